@@ -7,8 +7,9 @@ from astropy.time import Time
 from astropy.wcs import WCS
 
 
-@pytest.fixture()
-def catalog_file(tmp_path):
+@pytest.fixture(scope="module")
+def catalog_file(tmp_path_factory):
+    tmp_path = tmp_path_factory.mktemp("novt_fixtures")
     filename = tmp_path / "sources.radec"
     with filename.open("w") as fh:
         fh.write(
@@ -23,8 +24,9 @@ def catalog_file(tmp_path):
     return filename
 
 
-@pytest.fixture()
-def catalog_file_2col(tmp_path):
+@pytest.fixture(scope="module")
+def catalog_file_2col(tmp_path_factory):
+    tmp_path = tmp_path_factory.mktemp("novt_fixtures")
     filename = tmp_path / "sources_2col.radec"
     with filename.open("w") as fh:
         fh.write(
@@ -92,8 +94,9 @@ def catalog_dataframe_2col():
     )
 
 
-@pytest.fixture()
-def bad_catalog_file(tmp_path):
+@pytest.fixture(scope="module")
+def bad_catalog_file(tmp_path_factory):
+    tmp_path = tmp_path_factory.mktemp("novt_fixtures")
     filename = tmp_path / "bad.radec"
     filename.write_text("bad\n")
     return filename
@@ -161,7 +164,7 @@ def timeline_data():
     )
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def image_2d_wcs():
     return WCS(
         {
@@ -179,15 +182,34 @@ def image_2d_wcs():
     )
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
+def galactic_wcs():
+    return WCS(
+        {
+            "CTYPE1": "GLON-TAN",
+            "CUNIT1": "deg",
+            "CDELT1": -0.0002777777778,
+            "CRPIX1": 50,
+            "CRVAL1": 104.8514801,
+            "CTYPE2": "GLAT-TAN",
+            "CUNIT2": "deg",
+            "CDELT2": 0.0002777777778,
+            "CRPIX2": 50,
+            "CRVAL2": 68.5607630,
+        }
+    )
+
+
+@pytest.fixture(scope="session")
 def bad_wcs():
     return WCS(
         {"CDELT1": 1, "CRPIX1": 1, "CRVAL1": 1, "CDELT2": 1, "CRPIX2": 1, "CRVAL2": 1}
     )
 
 
-@pytest.fixture()
-def image_file(tmp_path, image_2d_wcs):
+@pytest.fixture(scope="module")
+def image_file(tmp_path_factory, image_2d_wcs):
+    tmp_path = tmp_path_factory.mktemp("novt_fixtures")
     hdul = fits.HDUList(
         fits.PrimaryHDU(np.zeros((10, 10)), header=image_2d_wcs.to_header())
     )
@@ -197,8 +219,9 @@ def image_file(tmp_path, image_2d_wcs):
     return filename
 
 
-@pytest.fixture()
-def image_file_no_wcs(tmp_path):
+@pytest.fixture(scope="module")
+def image_file_no_wcs(tmp_path_factory):
+    tmp_path = tmp_path_factory.mktemp("novt_fixtures")
     hdul = fits.HDUList(fits.PrimaryHDU(np.zeros((10, 10))))
     filename = tmp_path / "image_no_wcs.fits"
     hdul.writeto(str(filename), overwrite=True)
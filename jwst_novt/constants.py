@@ -1,5 +1,8 @@
 """Constants to standardize names and values."""
 import pathlib
+from types import MappingProxyType
+
+import numpy as np
 
 __all__ = [
     "NOVT_DIR",
@@ -13,65 +16,83 @@ __all__ = [
 ]
 
 
+def _offset_array(offsets):
+    """Make a read-only (N, 2) float array from a list of offset pairs."""
+    array = np.array(offsets, dtype=float)
+    array.setflags(write=False)
+    return array
+
+
 NOVT_DIR = pathlib.Path(__file__).parent.resolve()
 """pathlib.Path : Path to the top-level package directory."""
 
 
-INSTRUMENT_NAMES = {
-    "nirspec": "NIRSpec",
-    "nircam_long": "NIRCam Long",
-    "nircam_short": "NIRCam Short",
-}
-"""dict : Capitalized instrument names for display."""
+INSTRUMENT_NAMES = MappingProxyType(
+    {
+        "nirspec": "NIRSpec",
+        "nircam_long": "NIRCam Long",
+        "nircam_short": "NIRCam Short",
+    }
+)
+"""MappingProxyType : Capitalized instrument names for display."""
 
 
 # see JDox article, Table 1:
 # https://jwst-docs.stsci.edu/jwst-near-infrared-spectrograph/
 #    nirspec-operations/nirspec-mos-operations/
 #    nirspec-mos-operations-pre-imaging-using-nircam
-NIRCAM_DITHER_OFFSETS = {
-    "NONE": [(0.0, 0.0)],
-    "FULL3": [(-58.0, -23.5), (0.0, 0.0), (58.0, 23.5)],
-    "FULL3TIGHT": [(-58.0, -7.5), (0.0, 0.0), (58.0, 7.5)],
-    "FULL6": [
-        (-72.0, -30.0),
-        (-43.0, -18.0),
-        (-14.0, -6.0),
-        (15.0, 6.0),
-        (44.0, 18.0),
-        (73.0, 30.0),
-    ],
-    "8NIRSPEC": [
-        (-24.6, -64.1),
-        (-24.4, -89.0),
-        (24.6, -88.8),
-        (24.4, -63.9),
-        (24.6, 64.1),
-        (24.4, 89.0),
-        (-24.6, 88.8),
-        (-24.4, 63.9),
-    ],
-}
-"""dict : Dither offset values by pattern name, in telescope coordinates.
-
-V2 offsets are subtracted; V3 offsets are added.
+NIRCAM_DITHER_OFFSETS = MappingProxyType(
+    {
+        "NONE": _offset_array([(0.0, 0.0)]),
+        "FULL3": _offset_array([(-58.0, -23.5), (0.0, 0.0), (58.0, 23.5)]),
+        "FULL3TIGHT": _offset_array([(-58.0, -7.5), (0.0, 0.0), (58.0, 7.5)]),
+        "FULL6": _offset_array(
+            [
+                (-72.0, -30.0),
+                (-43.0, -18.0),
+                (-14.0, -6.0),
+                (15.0, 6.0),
+                (44.0, 18.0),
+                (73.0, 30.0),
+            ]
+        ),
+        "8NIRSPEC": _offset_array(
+            [
+                (-24.6, -64.1),
+                (-24.4, -89.0),
+                (24.6, -88.8),
+                (24.4, -63.9),
+                (24.6, 64.1),
+                (24.4, 89.0),
+                (-24.6, 88.8),
+                (-24.4, 63.9),
+            ]
+        ),
+    }
+)
+"""MappingProxyType : Dither offset values by pattern name, in telescope coordinates.
+
+Values are read-only arrays with shape (N, 2), holding (V2, V3)
+offsets in arcsec. V2 offsets are subtracted; V3 offsets are added.
 """
 
 
-NO_MOSAIC = {"8NIRSPEC"}
-"""set : Dither pattern values for which mosaic is not enabled."""
+NO_MOSAIC = frozenset({"8NIRSPEC"})
+"""frozenset : Dither pattern values for which mosaic is not enabled."""
 
 
-DEFAULT_COLOR = {
-    "NIRSpec": "#d62728",  # tab:red
-    "NIRCam Long": "#2ca02c",  # tab:green
-    "NIRCam Short": "#1f77b4",  # tab:blue
-    "NIRCam": "#1f77b4",  # tab:blue
-    "Primary Sources": "#ff7f0e",  # tab:orange
-    "Filler Sources": "#9467bd",  # tab:purple
-    "V3PA": "#7f7f7f",  # tab:gray
-}
-"""dict : Default colors for instrument footprint overlays.
+DEFAULT_COLOR = MappingProxyType(
+    {
+        "NIRSpec": "#d62728",  # tab:red
+        "NIRCam Long": "#2ca02c",  # tab:green
+        "NIRCam Short": "#1f77b4",  # tab:blue
+        "NIRCam": "#1f77b4",  # tab:blue
+        "Primary Sources": "#ff7f0e",  # tab:orange
+        "Filler Sources": "#9467bd",  # tab:purple
+        "V3PA": "#7f7f7f",  # tab:gray
+    }
+)
+"""MappingProxyType : Default colors for instrument footprint overlays.
 
 Values from defaults in matplotlib.colors.TABLEAU_COLORS.
 """
@@ -87,24 +108,30 @@ JWST_MAXIMUM_DATE = "2025-06-26"
 See: https://ssd.jpl.nasa.gov/horizons/time_spans.html
 """
 
-CONFIGURABLE = {
-    "nirspec": {"ra", "dec", "pa", "color_primary", "alpha"},
-    "nircam": {
-        "ra",
-        "dec",
-        "pa",
-        "dither",
-        "mosaic",
-        "mosaic_v2",
-        "mosaic_v3",
-        "color_primary",
-        "color_alternate",
-        "alpha",
-    },
-    "catalog": {"color_primary", "color_alternate"},
-    "timeline": {"start_date", "end_date", "instrument", "ra", "dec"},
-    "save": {"coordinates", "region_filename", "config_filename"},
-}
+CONFIGURABLE = MappingProxyType(
+    {
+        "nirspec": frozenset({"ra", "dec", "pa", "color_primary", "alpha"}),
+        "nircam": frozenset(
+            {
+                "ra",
+                "dec",
+                "pa",
+                "dither",
+                "mosaic",
+                "mosaic_v2",
+                "mosaic_v3",
+                "color_primary",
+                "color_alternate",
+                "alpha",
+            }
+        ),
+        "catalog": frozenset({"color_primary", "color_alternate"}),
+        "timeline": frozenset({"start_date", "end_date", "instrument", "ra", "dec"}),
+        "save": frozenset(
+            {"coordinates", "region_filename", "compress_regions", "config_filename"}
+        ),
+    }
+)
 """
-dict : Configurable items for interact controls.
+MappingProxyType : Configurable items for interact controls, by section.
 """
@@ -1,8 +1,10 @@
+import copy
+import functools
+import threading
+from pathlib import Path
+
 import numpy as np
 import pandas as pd
-import pysiaf
-import regions
-from astropy import coordinates
 
 from jwst_novt.constants import NIRCAM_DITHER_OFFSETS, NO_MOSAIC
 
@@ -11,9 +13,204 @@ __all__ = [
     "nircam_short_footprint",
     "nircam_long_footprint",
     "nircam_dither_footprint",
+    "nircam_channel_footprints",
     "source_catalog",
+    "source_catalog_arrays",
 ]
 
+_NIRCAM_SHORT_APERTURES = (
+    "NRCA1_FULL",
+    "NRCA2_FULL",
+    "NRCA3_FULL",
+    "NRCA4_FULL",
+    "NRCB1_FULL",
+    "NRCB2_FULL",
+    "NRCB3_FULL",
+    "NRCB4_FULL",
+)
+_NIRCAM_LONG_APERTURES = ("NRCA5_FULL", "NRCB5_FULL")
+
+# cached apertures are shared, so setting an attitude and reading
+# sky points from them must not interleave between threads
+_APERTURE_LOCK = threading.Lock()
+
+USE_FLOAT32_FOOTPRINTS = False
+"""bool : If set, footprint polygon vertices are stored as float32.
+
+This halves the size of footprint region sets, at the cost of
+sky position precision (about 0.1 arcsec at RA near 360 deg).
+"""
+
+
+@functools.cache
+def _siaf(instrument):
+    """Load the SIAF for an instrument, once per session."""
+    import pysiaf
+
+    return pysiaf.Siaf(instrument)
+
+
+@functools.cache
+def _reference_point(instrument, aperture_name, *, rederive=True):
+    """
+    Get the center and PA offset for a full instrument aperture.
+
+    The SIAF values do not change within a session, so the
+    result is computed once per aperture.
+
+    Parameters
+    ----------
+    instrument : {'NIRSpec', 'NIRCam'}
+        SIAF instrument name.
+    aperture_name : str
+        Name of the aperture defining the instrument center.
+    rederive : bool, optional
+        Passed to the aperture `corners` method.
+
+    Returns
+    -------
+    v2, v3, pa_offset : float
+        Mean of the aperture corners in telescope coordinates, and the
+        V3IdlYAngle for the aperture.
+    """
+    aperture = _siaf(instrument).apertures[aperture_name]
+    corner_v2, corner_v3 = aperture.corners("tel", rederive=rederive)
+
+    # return plain floats, to avoid numpy scalar overhead in
+    # the attitude computations that use these values
+    center_v2 = float(np.sum(corner_v2)) / len(corner_v2)
+    center_v3 = float(np.sum(corner_v3)) / len(corner_v3)
+    return center_v2, center_v3, float(aperture.V3IdlYAngle)
+
+
+@functools.lru_cache(maxsize=64)
+def _aperture(instrument, aperture_name):
+    """
+    Get a private copy of a SIAF aperture.
+
+    Footprint functions set the attitude matrix on the returned aperture,
+    so a copy is kept here to avoid modifying the apertures held by the
+    shared SIAF instance. The copy is itself shared by all callers, so
+    it should only be used with an attitude under `_APERTURE_LOCK`.
+
+    Parameters
+    ----------
+    instrument : str
+        Instrument name, as accepted by `pysiaf.Siaf`.
+    aperture_name : str
+        SIAF aperture name.
+
+    Returns
+    -------
+    aperture : pysiaf.Aperture
+        The cached aperture copy.
+    """
+    return copy.deepcopy(_siaf(instrument).apertures[aperture_name])
+
+
+def _nircam_apertures(aperture_names):
+    """Look up NIRCam SIAF apertures by name."""
+    return [_aperture("NIRCam", aperture_name) for aperture_name in aperture_names]
+
+
+def _nircam_footprint_core(
+    aperture_list, ra, dec, pa, *, v2_offset=0.0, v3_offset=0.0, include_center=True
+):
+    """
+    Create NIRCam footprint regions from SIAF aperture objects.
+
+    Parameters
+    ----------
+    aperture_list : list of pysiaf.Aperture
+        NIRCam apertures to include in the footprint.
+    ra : float
+        RA of NIRCam center, in degrees.
+    dec : float
+        Dec of NIRCam center, in degrees.
+    pa : float
+        Position angle for NIRCam, in degrees.
+    v2_offset : float, optional
+        Additional V2 offset to apply to the instrument center.
+    v3_offset : float, optional
+        Additional V3 offset to apply to the instrument center.
+    include_center : bool, optional
+        If set, the center is marked with a Point region.
+
+    Returns
+    -------
+    nrc_regions : list of regions.SkyRegion
+        NIRCam footprint regions.
+    """
+    import pysiaf
+    import regions
+    from astropy import coordinates
+
+    # Get center and PA offset from full aperture
+    center_v2, center_v3, pa_offset = _reference_point(
+        "NIRCam", "NRCALL_FULL", rederive=False
+    )
+    nrc_v2 = center_v2 - v2_offset
+    nrc_v3 = center_v3 + v3_offset
+
+    # Attitude matrix for sky coordinates
+    attmat = pysiaf.utils.rotations.attitude(nrc_v2, nrc_v3, ra, dec, pa - pa_offset)
+
+    # Aperture regions
+    nrc_regions = []
+    if include_center:
+        nrc_regions.append(
+            regions.PointSkyRegion(coordinates.SkyCoord(ra, dec, unit="deg"))
+        )
+    nrc_regions.extend(_polygon_regions(aperture_list, attmat))
+
+    return nrc_regions
+
+
+def _polygon_regions(aperture_list, attmat):
+    """
+    Make sky polygon regions for a set of apertures.
+
+    Polygon points for all apertures are converted to sky coordinates
+    together, then sliced into a region for each aperture.
+
+    Parameters
+    ----------
+    aperture_list : list of pysiaf.Aperture
+        Apertures to convert to regions.
+    attmat : numpy.ndarray
+        Attitude matrix to set on each aperture.
+
+    Returns
+    -------
+    polygon_regions : list of regions.PolygonSkyRegion
+        Polygon regions, in the same order as the input apertures.
+    """
+    import regions
+    from astropy import coordinates
+
+    ra_points, dec_points = [], []
+    with _APERTURE_LOCK:
+        for aperture in aperture_list:
+            aperture.set_attitude_matrix(attmat)
+            poly_ra, poly_dec = aperture.closed_polygon_points("sky")
+            ra_points.append(poly_ra)
+            dec_points.append(poly_dec)
+    if len(ra_points) == 0:
+        return []
+
+    dtype = np.float32 if USE_FLOAT32_FOOTPRINTS else np.float64
+    sky_coords = coordinates.SkyCoord(
+        np.concatenate(ra_points).astype(dtype, copy=False),
+        np.concatenate(dec_points).astype(dtype, copy=False),
+        unit="deg",
+    )
+    stops = np.cumsum([len(poly_ra) for poly_ra in ra_points])
+    starts = np.concatenate([[0], stops[:-1]])
+    return [
+        regions.PolygonSkyRegion(sky_coords[start:stop])
+        for start, stop in zip(starts, stops)
+    ]
+
 
 def nirspec_footprint(ra, dec, pa, *, include_center=True, apertures=None):
     """
@@ -57,6 +254,10 @@ def nirspec_footprint(ra, dec, pa, *, include_center=True, apertures=None):
         region; all other apertures are marked with Polygon regions.
         Output regions are in sky coordinates.
     """
+    import pysiaf
+    import regions
+    from astropy import coordinates
+
     if apertures is None:
         apertures = [
             "NRS_FULL_MSA1",
@@ -71,15 +272,8 @@ def nirspec_footprint(ra, dec, pa, *, include_center=True, apertures=None):
             "NRS_S200B1_SLIT",
         ]
 
-    # Siaf interface for NIRSpec
-    nirspec = pysiaf.Siaf("NIRSpec")
-
     # Get center and PA offset from MSA full aperture
-    msa_full = nirspec.apertures["NRS_FULL_MSA"]
-    msa_corners = msa_full.corners("tel")
-    msa_v2 = np.mean(msa_corners[0])
-    msa_v3 = np.mean(msa_corners[1])
-    pa_offset = msa_full.V3IdlYAngle
+    msa_v2, msa_v3, pa_offset = _reference_point("NIRSpec", "NRS_FULL_MSA")
 
     # Attitude matrix for sky coordinates
     attmat = pysiaf.utils.rotations.attitude(msa_v2, msa_v3, ra, dec, pa - pa_offset)
@@ -90,14 +284,8 @@ def nirspec_footprint(ra, dec, pa, *, include_center=True, apertures=None):
         nrs_regions.append(
             regions.PointSkyRegion(coordinates.SkyCoord(ra, dec, unit="deg"))
         )
-    for aperture_name in apertures:
-        aperture = nirspec.apertures[aperture_name]
-        aperture.set_attitude_matrix(attmat)
-        poly_points = aperture.closed_polygon_points("sky")
-
-        sky_coord = coordinates.SkyCoord(*poly_points, unit="deg")
-        reg = regions.PolygonSkyRegion(sky_coord)
-        nrs_regions.append(reg)
+    aperture_list = [_aperture("NIRSpec", aperture_name) for aperture_name in apertures]
+    nrs_regions.extend(_polygon_regions(aperture_list, attmat))
 
     return regions.Regions(nrs_regions)
 
@@ -149,47 +337,20 @@ def nircam_short_footprint(
         region; all other apertures are marked with Polygon regions.
         Output regions are in sky coordinates.
     """
-    if apertures is None:
-        apertures = [
-            "NRCA1_FULL",
-            "NRCA2_FULL",
-            "NRCA3_FULL",
-            "NRCA4_FULL",
-            "NRCB1_FULL",
-            "NRCB2_FULL",
-            "NRCB3_FULL",
-            "NRCB4_FULL",
-        ]
-
-    # Siaf interface for NIRCam
-    nircam = pysiaf.Siaf("NIRCam")
-
-    # Get center and PA offset from full aperture
-    nrc_full = nircam.apertures["NRCALL_FULL"]
-    nrc_corners = nrc_full.corners("tel", rederive=False)
-    nrc_v2 = np.mean(nrc_corners[0]) - v2_offset
-    nrc_v3 = np.mean(nrc_corners[1]) + v3_offset
-    pa_offset = nrc_full.V3IdlYAngle
-
-    # Attitude matrix for sky coordinates
-    attmat = pysiaf.utils.rotations.attitude(nrc_v2, nrc_v3, ra, dec, pa - pa_offset)
-
-    # Aperture regions
-    nrc_regions = []
-    if include_center:
-        nrc_regions.append(
-            regions.PointSkyRegion(coordinates.SkyCoord(ra, dec, unit="deg"))
-        )
-
-    for aperture_name in apertures:
-        aperture = nircam.apertures[aperture_name]
-        aperture.set_attitude_matrix(attmat)
-        poly_points = aperture.closed_polygon_points("sky")
-
-        sky_coord = coordinates.SkyCoord(*poly_points, unit="deg")
-        reg = regions.PolygonSkyRegion(sky_coord)
-        nrc_regions.append(reg)
+    import regions
 
+    if apertures is None:
+        apertures = _NIRCAM_SHORT_APERTURES
+
+    nrc_regions = _nircam_footprint_core(
+        _nircam_apertures(apertures),
+        ra,
+        dec,
+        pa,
+        v2_offset=v2_offset,
+        v3_offset=v3_offset,
+        include_center=include_center,
+    )
     return regions.Regions(nrc_regions)
 
 
@@ -233,37 +394,20 @@ def nircam_long_footprint(
         region; all other apertures are marked with Polygon regions.
         Output regions are in sky coordinates.
     """
-    if apertures is None:
-        apertures = ["NRCA5_FULL", "NRCB5_FULL"]
-
-    # Siaf interface for NIRCam
-    nircam = pysiaf.Siaf("NIRCam")
-
-    # Get center and PA offset from full aperture
-    nrc_full = nircam.apertures["NRCALL_FULL"]
-    nrc_corners = nrc_full.corners("tel", rederive=False)
-    nrc_v2 = np.mean(nrc_corners[0]) - v2_offset
-    nrc_v3 = np.mean(nrc_corners[1]) + v3_offset
-    pa_offset = nrc_full.V3IdlYAngle
-
-    # Attitude matrix for sky coordinates
-    attmat = pysiaf.utils.rotations.attitude(nrc_v2, nrc_v3, ra, dec, pa - pa_offset)
-
-    # Aperture regions
-    nrc_regions = []
-    if include_center:
-        nrc_regions.append(
-            regions.PointSkyRegion(coordinates.SkyCoord(ra, dec, unit="deg"))
-        )
-    for aperture_name in apertures:
-        aperture = nircam.apertures[aperture_name]
-        aperture.set_attitude_matrix(attmat)
-        poly_points = aperture.closed_polygon_points("sky")
-
-        sky_coord = coordinates.SkyCoord(*poly_points, unit="deg")
-        reg = regions.PolygonSkyRegion(sky_coord)
-        nrc_regions.append(reg)
+    import regions
 
+    if apertures is None:
+        apertures = _NIRCAM_LONG_APERTURES
+
+    nrc_regions = _nircam_footprint_core(
+        _nircam_apertures(apertures),
+        ra,
+        dec,
+        pa,
+        v2_offset=v2_offset,
+        v3_offset=v3_offset,
+        include_center=include_center,
+    )
     return regions.Regions(nrc_regions)
 
 
@@ -318,6 +462,10 @@ def nircam_dither_footprint(
         region; all other apertures are marked with Polygon regions.
         Output regions are in sky coordinates.
     """
+    import pysiaf
+    import regions
+    from astropy import coordinates
+
     pattern = dither_pattern.strip().upper()
     if pattern not in NIRCAM_DITHER_OFFSETS:
         msg = (
@@ -327,10 +475,14 @@ def nircam_dither_footprint(
         raise ValueError(msg)
     dither_offsets = NIRCAM_DITHER_OFFSETS[pattern]
 
-    if channel.strip().lower() == "short":
-        footprint_func = nircam_short_footprint
-    else:
-        footprint_func = nircam_long_footprint
+    if apertures is None:
+        if channel.strip().lower() == "short":
+            apertures = _NIRCAM_SHORT_APERTURES
+        else:
+            apertures = _NIRCAM_LONG_APERTURES
+
+    # look up the aperture objects once for all dither positions
+    aperture_list = _nircam_apertures(apertures)
 
     if pattern in NO_MOSAIC:
         add_mosaic = False
@@ -340,36 +492,116 @@ def nircam_dither_footprint(
     # note: if offsets are 0 but add_mosaic is set, two
     # footprint tiles are still created
     if add_mosaic:
-        center_offset = [
-            (mosaic_offset[0] / 2, -mosaic_offset[1] / 2),
-            (-mosaic_offset[0] / 2, mosaic_offset[1] / 2),
-        ]
+        half_offset = np.array([mosaic_offset[0], -mosaic_offset[1]]) / 2
+        center_offset = np.array([half_offset, -half_offset])
     else:
-        center_offset = [(0, 0)]
+        center_offset = np.zeros((1, 2))
 
+    # all (v2, v3) offsets, ordered by mosaic tile, then dither position
+    all_offsets = (center_offset[:, None, :] + dither_offsets[None, :, :]).reshape(
+        -1, 2
+    )
+
+    # include center only once, for all dither positions
     dithers = []
-    for mosaic_position in center_offset:
-        for offset in dither_offsets:
-            v2 = offset[0] + mosaic_position[0]
-            v3 = offset[1] + mosaic_position[1]
-            reg_list = footprint_func(
-                ra,
-                dec,
-                pa,
-                v2_offset=v2,
-                v3_offset=v3,
-                include_center=include_center,
-                apertures=apertures,
-            )
-            # include center only once
-            include_center = False
-
-            for reg in reg_list:
-                dithers.append(reg)
+    if include_center:
+        dithers.append(
+            regions.PointSkyRegion(coordinates.SkyCoord(ra, dec, unit="deg"))
+        )
+
+    # attitude inputs that are constant across positions
+    center_v2, center_v3, pa_offset = _reference_point(
+        "NIRCam", "NRCALL_FULL", rederive=False
+    )
+    pa_eff = pa - pa_offset
+    nrc_v2 = (center_v2 - all_offsets[:, 0]).tolist()
+    nrc_v3 = (center_v3 + all_offsets[:, 1]).tolist()
+
+    # positions are computed serially: the shared aperture objects hold
+    # the attitude matrix state, and the per-position work is too small
+    # to benefit from a thread pool
+    for v2, v3 in zip(nrc_v2, nrc_v3):
+        attmat = pysiaf.utils.rotations.attitude(v2, v3, ra, dec, pa_eff)
+        dithers.extend(_polygon_regions(aperture_list, attmat))
 
     return regions.Regions(dithers)
 
 
+def nircam_channel_footprints(
+    ra,
+    dec,
+    pa,
+    *,
+    dither_pattern="NONE",
+    add_mosaic=False,
+    mosaic_offset=None,
+    include_center=True,
+):
+    """
+    Dither and/or mosaic the NIRCam footprint for both channels at once.
+
+    The dither and mosaic positions are computed once and shared by the
+    short and long channel apertures. Results are the same as calling
+    `nircam_dither_footprint` separately for each channel.
+
+    Parameters
+    ----------
+    ra : float
+        RA of NIRCam center, in degrees.
+    dec : float
+        Dec of NIRCam center, in degrees.
+    pa : float
+        Position angle for NIRCam, in degrees measured from North
+        to central vertical axis in North to East direction.
+    dither_pattern : str, optional
+        Name of the dither pattern to apply.  Options are: NONE, FULL3,
+        FULL3TIGHT, FULL6, 8NIRSPEC.
+    add_mosaic : bool, optional
+        If False, mosaic offsets are ignored. Otherwise, a two-tile
+        mosaic is computed with window width specified in `mosaic_offset`.
+    mosaic_offset : tuple or list, optional
+        (V2, V3) offset in telescope coordinates to apply as a two-tile
+        mosaic offset.  Ignored if `dither_pattern` is 8NIRSPEC or
+        `add_mosaic` is not set.
+    include_center : bool, optional
+        If set, the center is marked with a Point region in each
+        channel footprint.
+
+    Returns
+    -------
+    footprints : dict
+        Keys are 'short' and 'long'; values are the `regions.Regions`
+        footprint for each channel, in sky coordinates.
+    """
+    import regions
+
+    n_short = len(_NIRCAM_SHORT_APERTURES)
+    n_all = n_short + len(_NIRCAM_LONG_APERTURES)
+    combined = nircam_dither_footprint(
+        ra,
+        dec,
+        pa,
+        dither_pattern=dither_pattern,
+        add_mosaic=add_mosaic,
+        mosaic_offset=mosaic_offset,
+        include_center=include_center,
+        apertures=_NIRCAM_SHORT_APERTURES + _NIRCAM_LONG_APERTURES,
+    )
+
+    # split apertures by channel, for each dither position
+    center = list(combined[:1]) if include_center else []
+    polygons = list(combined[1:] if include_center else combined)
+    short, long = [], []
+    for start in range(0, len(polygons), n_all):
+        short.extend(polygons[start : start + n_short])
+        long.extend(polygons[start + n_short : start + n_all])
+
+    return {
+        "short": regions.Regions(center + short),
+        "long": regions.Regions(copy.deepcopy(center) + long),
+    }
+
+
 def source_catalog(catalog_file):
     """
     Create point regions for a source catalog.
@@ -382,13 +614,14 @@ def source_catalog(catalog_file):
     It is suitable for saving to DS9 region files, for example, but
     for display purposes, it may be faster to make a scatter plot out
     of all sources at once, directly from the catalog.  See
-    `jwst_novt.display.bqplot_catalog` for an example.
+    `source_catalog_arrays` and `jwst_novt.interact.display.bqplot_catalog`
+    for an example.
 
     Parameters
     ----------
-    catalog_file : str or pandas.DataFrame
-        Path to a .radec catalog file or a DataFrame containing columns
-        'ra', 'dec', and optionally, 'flag'.
+    catalog_file : str, pathlib.Path, file-like, or pandas.DataFrame
+        Path to a .radec catalog file, an open file object, or a
+        DataFrame containing columns 'ra', 'dec', and optionally, 'flag'.
 
     Returns
     -------
@@ -397,43 +630,136 @@ def source_catalog(catalog_file):
         and filler sources. All contained regions are Point regions in
         sky coordinates.
     """
-    # load the source catalog
+    ra_primary, dec_primary, ra_filler, dec_filler = source_catalog_arrays(catalog_file)
+    primary_regions = _point_regions(ra_primary, dec_primary)
+    filler_regions = _point_regions(ra_filler, dec_filler)
+
+    return primary_regions, filler_regions
+
+
+def source_catalog_arrays(catalog_file):
+    """
+    Load source coordinates from a catalog, sorted by flag.
+
+    The input catalog is in '.radec' form, as for `source_catalog`.
+    Coordinates are returned as plain arrays, without creating a region
+    for each source, so this method is suitable for display purposes.
+
+    Parameters
+    ----------
+    catalog_file : str, pathlib.Path, file-like, or pandas.DataFrame
+        Path to a .radec catalog file, an open file object, or a
+        DataFrame containing columns 'ra', 'dec', and optionally, 'flag'.
+
+    Returns
+    -------
+    ra_primary, dec_primary, ra_filler, dec_filler : numpy.ndarray
+        RA and Dec in degrees for primary and filler sources.
+    """
+    ra, dec, flag = _load_catalog(catalog_file)
+    filler = flag == "F"
+    primary = ~filler
+    return ra[primary], dec[primary], ra[filler], dec[filler]
+
+
+def _load_catalog(catalog_file):
+    """
+    Load RA, Dec, and flag arrays from a catalog file or DataFrame.
+
+    Parameters
+    ----------
+    catalog_file : str, pathlib.Path, file-like, or pandas.DataFrame
+        Path to a .radec catalog file, an open file object, or a
+        DataFrame containing columns 'ra', 'dec', and optionally, 'flag'.
+
+    Returns
+    -------
+    ra, dec, flag : numpy.ndarray, numpy.ndarray, numpy.ndarray
+        Source RA and Dec in degrees, and source flags.
+
+    Raises
+    ------
+    ValueError
+        If the catalog is empty or improperly formatted.
+    """
     if isinstance(catalog_file, pd.DataFrame):
-        catalog = catalog_file
-        if "flag" not in catalog:
-            catalog["flag"] = "P"
+        # extract both coordinate columns at once, as a float array;
+        # the input DataFrame is not modified
+        ra, dec = catalog_file.loc[:, ["ra", "dec"]].to_numpy(dtype=np.float64).T
+        if "flag" in catalog_file.columns:
+            flag = catalog_file["flag"].to_numpy()
+        else:
+            flag = np.full(len(ra), "P")
     else:
-        try:
-            catalog = pd.read_csv(
-                catalog_file,
-                names=["ra", "dec", "flag"],
-                delim_whitespace=True,
-                usecols=[0, 1, 2],
-            )
-        except ValueError:
-            # try again with two columns
-            catalog = pd.read_csv(
-                catalog_file, names=["ra", "dec"], delim_whitespace=True, usecols=[0, 1]
-            )
-            catalog["flag"] = "P"
-
-    if len(catalog.index) == 0:
+        ra, dec, flag = _read_radec(catalog_file)
+
+    if len(ra) == 0:
         msg = "Catalog file is empty."
         raise ValueError(msg)
 
-    filler = catalog["flag"] == "F"
-    primary = ~filler
+    return ra, dec, flag
 
-    primary_regions = []
-    for ra, dec in zip(catalog["ra"][primary], catalog["dec"][primary]):
-        primary_regions.append(
-            regions.PointSkyRegion(coordinates.SkyCoord(ra, dec, unit="deg"))
-        )
 
-    filler_regions = []
-    for ra, dec in zip(catalog["ra"][filler], catalog["dec"][filler]):
-        filler_regions.append(
-            regions.PointSkyRegion(coordinates.SkyCoord(ra, dec, unit="deg"))
-        )
+def _read_radec(catalog_file):
+    """
+    Read RA, Dec, and flag columns from a .radec catalog file.
+
+    Blank lines and lines starting with '#' are skipped. Columns beyond
+    the third are ignored. Rows with only two columns are flagged as
+    primary ('P').
+
+    Parameters
+    ----------
+    catalog_file : str, pathlib.Path, or file-like
+        Path to a .radec catalog file or an open file object.
+
+    Returns
+    -------
+    ra, dec, flag : numpy.ndarray, numpy.ndarray, numpy.ndarray
+        Source RA and Dec in degrees, and source flags.
+
+    Raises
+    ------
+    ValueError
+        If the catalog is empty or has fewer than 2 columns.
+    """
+    if hasattr(catalog_file, "read"):
+        text = catalog_file.read()
+    else:
+        text = Path(catalog_file).read_text()
+    if isinstance(text, bytes):
+        text = text.decode()
+
+    lines = [
+        line
+        for line in text.splitlines()
+        if line.strip() and not line.lstrip().startswith("#")
+    ]
+    if len(lines) == 0:
+        msg = "Catalog file is empty."
+        raise ValueError(msg)
 
-    return regions.Regions(primary_regions), regions.Regions(filler_regions)
+    # the flag column is optional on each row: rows without
+    # one are primary sources
+    rows = [line.split() for line in lines]
+    n_required = 2
+    for row in rows:
+        if len(row) < n_required:
+            msg = f"Catalog has {len(row)} column(s); expected 2 or 3."
+            raise ValueError(msg)
+
+    ra = np.array([row[0] for row in rows], dtype=float)
+    dec = np.array([row[1] for row in rows], dtype=float)
+    flag = np.array([row[2] if len(row) > n_required else "P" for row in rows])
+    return ra, dec, flag
+
+
+def _point_regions(ra, dec):
+    """Make point regions from arrays of RA and Dec values, in degrees."""
+    import regions
+    from astropy import coordinates
+
+    # convert all coordinates at once, then index the
+    # result for each region
+    sky_coords = coordinates.SkyCoord(ra, dec, unit="deg")
+    return regions.Regions([regions.PointSkyRegion(coord) for coord in sky_coords])
@@ -1,11 +1,25 @@
+from typing import ClassVar
+
 import ipywidgets as ipw
-from traitlets import Float, HasTraits, Unicode
+from IPython.display import display
+from traitlets import Float, HasTraits, Unicode, observe, validate
 
 from jwst_novt.constants import DEFAULT_COLOR, NIRCAM_DITHER_OFFSETS, NO_MOSAIC
 from jwst_novt.interact.utils import read_image
 
 __all__ = ["ControlInstruments"]
 
+# dither pattern names, in display order
+_DITHER_VALUES = tuple(NIRCAM_DITHER_OFFSETS)
+
+# default overlay colors for the instrument controls
+_NIRCAM_SHORT_COLOR = DEFAULT_COLOR["NIRCam Short"]
+_NIRCAM_LONG_COLOR = DEFAULT_COLOR["NIRCam Long"]
+_NIRSPEC_COLOR = DEFAULT_COLOR["NIRSpec"]
+
+# RA/Dec step size, in degrees
+_FIVE_ARCSEC = 0.0014
+
 
 class ControlInstruments(HasTraits):
     """Widgets to control instrument aperture overlay configuration."""
@@ -21,6 +35,57 @@ class ControlInstruments(HasTraits):
     color_alternate = Unicode("blue").tag(sync=True)
     alpha = Float(0.1).tag(sync=True)
 
+    # widget attribute name, widget class, widget keywords, and
+    # linked trait name for the float value controls
+    _WIDGET_SPEC: ClassVar[tuple] = (
+        (
+            "set_ra",
+            ipw.BoundedFloatText,
+            {
+                "description": "RA (deg)",
+                "min": 0,
+                "max": 360,
+                "step": _FIVE_ARCSEC,
+                "tooltip": "Right ascension coordinate for instrument center",
+            },
+            "ra",
+        ),
+        (
+            "set_dec",
+            ipw.BoundedFloatText,
+            {
+                "description": "Dec (deg)",
+                "min": -90,
+                "max": 90,
+                "step": _FIVE_ARCSEC,
+                "tooltip": "Declination coordinate for instrument center",
+            },
+            "dec",
+        ),
+        (
+            "set_pa",
+            ipw.FloatText,
+            {
+                "description": "PA (deg)",
+                "step": 5,
+                "tooltip": "Position angle of vertical axis, from North to East",
+            },
+            "pa",
+        ),
+        (
+            "set_alpha",
+            ipw.BoundedFloatText,
+            {
+                "description": "Fill opacity",
+                "min": 0,
+                "max": 1,
+                "step": 0.1,
+                "tooltip": "Set to 0 for no fill; 1 for opaque overlays",
+            },
+            "alpha",
+        ),
+    )
+
     def __init__(self, instrument, viz):
         super().__init__(self)
 
@@ -29,110 +94,94 @@ class ControlInstruments(HasTraits):
         self.title = f"Configure {instrument} Apertures"
         self.viz = viz
         self.viewer = viz.default_viewer._obj
-        self.dither_values = list(NIRCAM_DITHER_OFFSETS.keys())
-
-        # instrument logo image
-        if self.instrument == "NIRCam":
-            self.logo = read_image("nircamlogo.png", width="130px")
-        else:
-            self.logo = read_image("nirspeclogo.png")
-
-        # controls for center and position angle
-        five_arcsec = 0.0014
-        self.set_ra = ipw.BoundedFloatText(
-            description="RA (deg)",
-            min=0,
-            max=360,
-            step=five_arcsec,
-            continuous_update=False,
-            style={"description_width": "initial"},
-            tooltip="Right ascension coordinate for instrument center",
-        )
-        self.set_dec = ipw.BoundedFloatText(
-            description="Dec (deg)",
-            min=-90,
-            max=90,
-            step=five_arcsec,
-            continuous_update=False,
-            style={"description_width": "initial"},
-            tooltip="Declination coordinate for instrument center",
-        )
-        self.set_pa = ipw.FloatText(
-            description="PA (deg)",
-            step=5,
-            continuous_update=False,
-            style={"description_width": "initial"},
-            tooltip="Position angle of vertical axis, from North to East",
-        )
+        self.dither_values = _DITHER_VALUES
 
-        ipw.link((self.set_ra, "value"), (self, "ra"))
-        ipw.link((self.set_dec, "value"), (self, "dec"))
+        # layout widgets are built on first use
+        self._widgets = None
+        self._logo = None
+        self._mosaic_fields = None
 
-        # set pa link from self to widget only and directly
-        # handle setting from widget input in order to wrap
-        # angle properly from widget nudge
-        self.set_pa.observe(self._wrap_angle, "value")
-        ipw.dlink((self, "pa"), (self.set_pa, "value"))
+        # create widgets and links, and seed initial values from the
+        # viewer, with trait notifications coalesced until all are set
+        with self.hold_trait_notifications():
+            # set a callback in the viewer to initialize RA/Dec
+            # from WCS on data load
+            self.viewer.state.add_callback("reference_data", self._set_from_wcs)
 
-        # select box and text entry for dither and
-        # mosaic patterns (NIRCam only)
-        self.set_dither = None
-        self.set_mosaic = None
-        self.set_mosaic_v2 = None
-        self.set_mosaic_v3 = None
-        if self.instrument == "NIRCam":
-            self._init_dither_widgets()
-
-            # color controls
-            self.color_pickers = [
-                ipw.ColorPicker(
-                    description="Short color",
-                    value=DEFAULT_COLOR["NIRCam Short"],
-                    style={"description_width": "initial"},
-                    tooltip="Color for NIRCam Short overlays",
-                ),
-                ipw.ColorPicker(
-                    description="Long color",
-                    value=DEFAULT_COLOR["NIRCam Long"],
-                    style={"description_width": "initial"},
-                    tooltip="Color for NIRCam Long overlays",
-                ),
-            ]
-            ipw.link((self.color_pickers[0], "value"), (self, "color_primary"))
-            ipw.link((self.color_pickers[1], "value"), (self, "color_alternate"))
-        else:
-            # color controls
-            self.color_pickers = [
-                ipw.ColorPicker(
-                    description="Color",
-                    value=DEFAULT_COLOR["NIRSpec"],
+            # also call it now in case viewer already has data loaded,
+            # so that widgets below are created with the initial values
+            if self.viewer.state.reference_data is not None:
+                self._set_from_wcs()
+
+            # controls for center, position angle, and fill opacity
+            for name, widget_class, kwargs, trait in self._WIDGET_SPEC:
+                widget = widget_class(
+                    value=getattr(self, trait),
+                    continuous_update=False,
                     style={"description_width": "initial"},
-                    tooltip="Color for NIRSpec overlays",
-                ),
-            ]
-            ipw.link((self.color_pickers[0], "value"), (self, "color_primary"))
-
-        # fill alpha for overlays
-        self.set_alpha = ipw.BoundedFloatText(
-            value=0.1,
-            description="Fill opacity",
-            min=0,
-            max=1,
-            step=0.1,
-            continuous_update=False,
-            style={"description_width": "initial"},
-            tooltip="Set to 0 for no fill; 1 for opaque overlays",
-        )
-        ipw.link((self.set_alpha, "value"), (self, "alpha"))
+                    **kwargs,
+                )
+                setattr(self, name, widget)
+                if trait == "pa":
+                    # set pa link from self to widget only and directly
+                    # handle setting from widget input in order to wrap
+                    # angle properly from widget nudge
+                    widget.observe(self._wrap_angle, "value")
+                    ipw.dlink((self, trait), (widget, "value"))
+                else:
+                    ipw.link((widget, "value"), (self, trait))
+
+            # select box and text entry for dither and
+            # mosaic patterns (NIRCam only)
+            self.set_dither = None
+            self.set_mosaic = None
+            self.set_mosaic_v2 = None
+            self.set_mosaic_v3 = None
+            if self.instrument == "NIRCam":
+                self._init_dither_widgets()
+
+                # color controls
+                self.color_pickers = [
+                    ipw.ColorPicker(
+                        description="Short color",
+                        value=_NIRCAM_SHORT_COLOR,
+                        style={"description_width": "initial"},
+                        tooltip="Color for NIRCam Short overlays",
+                    ),
+                    ipw.ColorPicker(
+                        description="Long color",
+                        value=_NIRCAM_LONG_COLOR,
+                        style={"description_width": "initial"},
+                        tooltip="Color for NIRCam Long overlays",
+                    ),
+                ]
+                ipw.link((self.color_pickers[0], "value"), (self, "color_primary"))
+                ipw.link((self.color_pickers[1], "value"), (self, "color_alternate"))
+            else:
+                # color controls
+                self.color_pickers = [
+                    ipw.ColorPicker(
+                        description="Color",
+                        value=_NIRSPEC_COLOR,
+                        style={"description_width": "initial"},
+                        tooltip="Color for NIRSpec overlays",
+                    ),
+                ]
+                ipw.link((self.color_pickers[0], "value"), (self, "color_primary"))
 
-        # set a callback in the viewer to initialize RA/Dec
-        # from WCS on data load
-        self.viewer.state.add_callback("reference_data", self._set_from_wcs)
+    @property
+    def widgets(self):
+        """ipywidgets.Accordion : Top-level widget for the control panel."""
+        if self._widgets is None:
+            self._widgets = self._build_layout()
+        return self._widgets
 
-        # also call it now in case viewer already has data loaded
-        self._set_from_wcs()
+    def _ipython_display_(self, **kwargs):
+        """Display the control panel widgets."""
+        display(self.widgets, **kwargs)
 
-        # layout widgets
+    def _build_layout(self):
+        """Lay out the control widgets in a top-level container."""
         row_layout = ipw.Layout(
             display="flex", flex_flow="row", justify_content="flex-start", padding="0px"
         )
@@ -142,32 +191,27 @@ class ControlInstruments(HasTraits):
         center_buttons = ipw.Box(
             children=[self.set_ra, self.set_dec, self.set_pa], layout=row_layout
         )
-        appearance_tab = ipw.Accordion(
-            children=[
-                ipw.Box(
-                    children=[*self.color_pickers, self.set_alpha], layout=row_layout
-                )
-            ],
-            titles=["Appearance"],
+        appearance_box = ipw.Box(
+            children=[*self.color_pickers, self.set_alpha], layout=row_layout
         )
 
         children = [center_buttons]
         if self.set_dither is not None:
-            mosaic_fields = ipw.Box(
-                children=[self.set_mosaic, self.set_mosaic_v2, self.set_mosaic_v3],
-                layout=row_layout,
-            )
-            children.extend([mosaic_fields, self.set_dither])
-        position_tab = ipw.Accordion(
-            children=[ipw.Box(children=children, layout=column_layout)],
-            titles=["Position"],
+            mosaic_children = [self.set_mosaic]
+            if self.set_mosaic_v2 is not None:
+                mosaic_children.extend([self.set_mosaic_v2, self.set_mosaic_v3])
+            self._mosaic_fields = ipw.Box(children=mosaic_children, layout=row_layout)
+            children.extend([self._mosaic_fields, self.set_dither])
+        position_box = ipw.Box(children=children, layout=column_layout)
+
+        # one accordion holds both position and appearance sections
+        sections = ipw.Accordion(
+            children=[position_box, appearance_box],
+            titles=["Position", "Appearance"],
             selected_index=0,
         )
-
-        children = [position_tab, appearance_tab]
-        col = ipw.Box(children=children, layout=column_layout)
         row = ipw.Box(
-            children=[self.logo, col],
+            children=[self.logo, sections],
             layout=ipw.Layout(
                 display="flex",
                 flex_flow="row",
@@ -175,7 +219,17 @@ class ControlInstruments(HasTraits):
                 align_items="center",
             ),
         )
-        self.widgets = ipw.Accordion(children=[row], titles=[self.title])
+        return ipw.Accordion(children=[row], titles=[self.title])
+
+    @property
+    def logo(self):
+        """ipywidgets.Image : Instrument logo image."""
+        if self._logo is None:
+            if self.instrument == "NIRCam":
+                self._logo = read_image("nircamlogo.png", width="130px")
+            else:
+                self._logo = read_image("nirspeclogo.png")
+        return self._logo
 
     def _init_dither_widgets(self):
         """Set up dither widgets for NIRCam."""
@@ -186,7 +240,6 @@ class ControlInstruments(HasTraits):
             tooltip="Apply a NIRCam dither pattern",
         )
         ipw.link((self.set_dither, "value"), (self, "dither"))
-        self.set_dither.observe(self._check_mosaic_from_dither, "value")
 
         self.set_mosaic = ipw.Dropdown(
             description="Mosaic",
@@ -195,9 +248,15 @@ class ControlInstruments(HasTraits):
             tooltip="Apply a two-tile NIRCam mosaic",
         )
         ipw.link((self.set_mosaic, "value"), (self, "mosaic"))
-        self.set_mosaic.observe(self._check_mosaic, "value")
 
+        # mosaic offset widgets are created when mosaic is first enabled
+        self.set_mosaic_v2 = None
+        self.set_mosaic_v3 = None
+
+    def _init_mosaic_offset_widgets(self):
+        """Set up mosaic offset widgets for NIRCam."""
         self.set_mosaic_v2 = ipw.BoundedFloatText(
+            value=self.mosaic_v2,
             description="Horizontal offset (arcsec)",
             min=-3600,
             max=3600,
@@ -207,6 +266,7 @@ class ControlInstruments(HasTraits):
             tooltip="V2 distance between mosaic tile centers",
         )
         self.set_mosaic_v3 = ipw.BoundedFloatText(
+            value=self.mosaic_v3,
             description="Vertical offset (arcsec)",
             min=-3600,
             max=3600,
@@ -220,18 +280,29 @@ class ControlInstruments(HasTraits):
         ipw.link((self.set_mosaic_v2, "value"), (self, "mosaic_v2"))
         ipw.link((self.set_mosaic_v3, "value"), (self, "mosaic_v3"))
 
+        # add to the layout, if already built
+        if self._mosaic_fields is not None:
+            self._mosaic_fields.children = [
+                self.set_mosaic,
+                self.set_mosaic_v2,
+                self.set_mosaic_v3,
+            ]
+
+    @validate("pa")
+    def _validate_pa(self, proposal):
+        """Wrap PA values to expected range (0-360)."""
+        return proposal["value"] % 360
+
     def _wrap_angle(self, change):
-        """Wrap input angles to expected range (0-360)."""
-        angle = change["new"]
-        ndeg = 360
-        if angle < 0 or angle >= ndeg:
-            # change angle in widget only:
-            # the change will trigger a new call to set the
-            # PA trait to the wrapped value
-            angle = (angle + ndeg) % ndeg
-            self.set_pa.value = angle
-        else:
-            self.pa = angle
+        """Set PA from widget input, wrapped to expected range (0-360)."""
+        # the PA validator wraps the angle, and the link from PA
+        # to the widget updates the widget if the trait changed
+        self.pa = change["new"]
+
+        # the widget may still hold the unwrapped value if the
+        # trait was already set to the wrapped angle
+        if self.set_pa.value != self.pa:
+            self.set_pa.value = self.pa
 
     def _set_from_wcs(self, *args, **kwargs):
         """Set default RA and Dec from a newly uploaded file."""
@@ -242,28 +313,48 @@ class ControlInstruments(HasTraits):
                 self.ra = float(ra)
                 self.dec = float(dec)
 
+    @observe("dither")
     def _check_mosaic_from_dither(self, change):
         """Enable or disable mosaic buttons based on dither value."""
-        pattern = change["new"]
-        if pattern in NO_MOSAIC:
-            # this dither pattern does not allow mosaics
-            self.set_mosaic.disabled = True
-            self.set_mosaic_v2.disabled = True
-            self.set_mosaic_v3.disabled = True
-        elif self.mosaic != "No":
-            self.set_mosaic.disabled = False
-            self.set_mosaic_v2.disabled = False
-            self.set_mosaic_v3.disabled = False
-        else:
-            self.set_mosaic.disabled = False
+        if self.set_mosaic is None:
+            # no mosaic controls for this instrument
+            return
 
+        # mosaics are not allowed for some dither patterns
+        no_mosaic = change["new"] in NO_MOSAIC
+        disabled = {"set_mosaic": no_mosaic}
+        if no_mosaic or self.mosaic != "No":
+            disabled["set_mosaic_v2"] = no_mosaic
+            disabled["set_mosaic_v3"] = no_mosaic
+        self._set_disabled(disabled)
+
+    @observe("mosaic")
     def _check_mosaic(self, change):
         """Set offset state from mosaic choice."""
-        mosaic = change["new"]
-        if mosaic == "No":
-            # turn off mosaic offsets
-            self.set_mosaic_v2.disabled = True
-            self.set_mosaic_v3.disabled = True
-        else:
-            self.set_mosaic_v2.disabled = False
-            self.set_mosaic_v3.disabled = False
+        if self.set_mosaic is None:
+            # no mosaic controls for this instrument
+            return
+
+        # offsets are only editable if mosaic is on
+        no_offsets = change["new"] == "No"
+        if not no_offsets and self.set_mosaic_v2 is None:
+            self._init_mosaic_offset_widgets()
+        self._set_disabled({"set_mosaic_v2": no_offsets, "set_mosaic_v3": no_offsets})
+
+    def _set_disabled(self, disabled):
+        """
+        Set the disabled state for a set of widgets.
+
+        Widgets are only updated if their state changes, to avoid
+        sending unnecessary updates to the front end.
+
+        Parameters
+        ----------
+        disabled : dict
+            Keys are widget attribute names; values are the disabled
+            state to set.
+        """
+        for name, state in disabled.items():
+            widget = getattr(self, name)
+            if widget is not None and widget.disabled != state:
+                widget.disabled = state
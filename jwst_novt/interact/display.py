@@ -1,20 +1,23 @@
 import datetime
+import hashlib
+import os
 import re
+import weakref
 from contextlib import ExitStack, contextmanager, suppress
-from functools import partial
+from functools import lru_cache, partial
+from pathlib import Path
 
 import bqplot
 import ipywidgets as ipw
 import numpy as np
-import pandas as pd
 import regions
-from astropy import units as u
-from astropy.stats import circmean
+from astropy.coordinates import concatenate
 from astropy.time import Time
 
 from jwst_novt import footprints as fp
 from jwst_novt import timeline as tl
 from jwst_novt.constants import DEFAULT_COLOR, INSTRUMENT_NAMES
+from jwst_novt.interact.utils import Debouncer
 
 __all__ = [
     "hold_all_sync",
@@ -26,9 +29,30 @@ __all__ = [
     "BqplotToolbar",
 ]
 
+# whitespace in input instrument names
+_WHITESPACE = re.compile(r"\s")
+
+# scale observers added to figures, removed when the figure is cleared
+_figure_callbacks = weakref.WeakKeyDictionary()
+
+# x and y scales for each figure, with the interaction they came from
+_figure_scale_cache = weakref.WeakKeyDictionary()
+
+# footprint geometry for each set of footprint marks, keyed by first mark
+_footprint_geometry = weakref.WeakKeyDictionary()
+
+# decimal places kept for footprint cache keys: 1e-7 deg for positions
+# and angles, 1e-4 arcsec for mosaic offsets
+_FOOTPRINT_DEG_DIGITS = 7
+_FOOTPRINT_ARCSEC_DIGITS = 4
+
+# pixel positions for recently displayed catalogs
+_CATALOG_CACHE_SIZE = 4
+_catalog_pixels = {}
+
 
 @contextmanager
-def hold_all_sync(marks):
+def hold_all_sync(marks, fig=None):
     """
     Hold sync for a set of bqplot marks.
 
@@ -40,8 +64,13 @@ def hold_all_sync(marks):
     ----------
     marks : list of bqplot.Mark
         A list of patches to update together.
+    fig : bqplot.Figure, optional
+        If provided, sync is also held for the figure, so that changes
+        to its marks, axes, or other attributes are sent together.
     """
     with ExitStack() as stack:
+        if fig is not None:
+            stack.enter_context(fig.hold_sync())
         for mark in marks:
             stack.enter_context(mark.hold_sync())
         yield
@@ -161,89 +190,221 @@ def bqplot_footprint(
         Marks added to the figure.
     """
     # standardize input
-    inst = re.sub(r"\s", "_", instrument.strip().lower())
-    inst = INSTRUMENT_NAMES[inst]
-
-    dither_pattern = str(dither_pattern).strip().upper()
+    inst = _instrument_name(instrument)
+    dither_pattern = _dither_name(dither_pattern)
 
     # get footprint configuration by instrument
     if color is None:
         color = DEFAULT_COLOR[inst]
 
+    # style values are the same for every mark
+    colors = [color]
+    opacities = [alpha]
+    fill_opacities = [fill_alpha]
+
+    # if only display style changed, update existing patches in place,
+    # without recomputing the footprint
+    if mosaic_offset is not None:
+        mosaic_offset = tuple(mosaic_offset)
+    geometry = (inst, ra, dec, pa, dither_pattern, add_mosaic, mosaic_offset, wcs)
+    if update_patches and _footprint_geometry.get(update_patches[0]) == geometry:
+        for mark in update_patches:
+            with mark.hold_sync():
+                _set_footprint_style(mark, colors, fill, opacities, fill_opacities)
+                mark.visible = visible
+        return update_patches
+
     # make regions
-    if inst == "NIRSpec":
-        regs = fp.nirspec_footprint(ra, dec, pa)
-    else:
-        # 'NIRCam Short' or 'NIRCam Long'
-        channel = inst.split()[-1].lower()
-        regs = fp.nircam_dither_footprint(
-            ra,
-            dec,
-            pa,
-            channel=channel,
-            dither_pattern=dither_pattern,
-            add_mosaic=add_mosaic,
-            mosaic_offset=mosaic_offset,
-        )
+    regs = _footprint_regions(
+        inst,
+        ra,
+        dec,
+        pa,
+        dither_pattern=dither_pattern,
+        add_mosaic=add_mosaic,
+        mosaic_offset=mosaic_offset,
+    )
 
     # get scales from figure
-    scales = {"x": fig.interaction.x_scale, "y": fig.interaction.y_scale}
-
-    marks = []
-    for i, reg in enumerate(regs):
-        pixel_region = reg.to_pixel(wcs)
-        if isinstance(pixel_region, regions.PointPixelRegion):
-            if update_patches is not None:
-                mark = update_patches[i]
-                with mark.hold_sync():
-                    mark.x = [pixel_region.center.x]
-                    mark.y = [pixel_region.center.y]
-                    mark.colors = [color]
-                    mark.default_opacities = [alpha]
-            else:
-                # instrument center point
-                mark = bqplot.Scatter(
-                    x=[pixel_region.center.x],
-                    y=[pixel_region.center.y],
-                    scales=scales,
-                    colors=[color],
-                    marker="plus",
-                )
-                mark.default_opacities = [alpha]
+    scales = _figure_scales(fig)
+
+    # convert all region coordinates to pixels at once
+    pixel_coords = _regions_to_pixel(regs, wcs)
+
+    marks = [None] * len(pixel_coords)
+    for i, (is_point, x_coords, y_coords) in enumerate(pixel_coords):
+        if update_patches is not None:
+            mark = update_patches[i]
+            with mark.hold_sync():
+                mark.x = x_coords
+                mark.y = y_coords
+                _set_footprint_style(mark, colors, fill, opacities, fill_opacities)
+        elif is_point:
+            # instrument center point
+            mark = bqplot.Scatter(
+                x=x_coords,
+                y=y_coords,
+                scales=scales,
+                colors=colors,
+                marker="plus",
+            )
+            mark.default_opacities = opacities
         else:
-            x_coords = pixel_region.vertices.x
-            y_coords = pixel_region.vertices.y
-            if update_patches is not None:
-                mark = update_patches[i]
-                with mark.hold_sync():
-                    mark.x = x_coords
-                    mark.y = y_coords
-                    mark.fill = fill
-                    mark.colors = [color]
-                    mark.opacities = [alpha]
-                    mark.fill_opacities = [fill_alpha]
-            else:
-                # instrument aperture regions
-                mark = bqplot.Lines(
-                    x=x_coords,
-                    y=y_coords,
-                    scales=scales,
-                    fill=fill,
-                    colors=[color],
-                    stroke_width=2,
-                    close_path=True,
-                    opacities=[alpha],
-                    fill_opacities=[fill_alpha],
-                )
+            # instrument aperture regions
+            mark = bqplot.Lines(
+                x=x_coords,
+                y=y_coords,
+                scales=scales,
+                fill=fill,
+                colors=colors,
+                stroke_width=2,
+                close_path=True,
+                opacities=opacities,
+                fill_opacities=fill_opacities,
+            )
 
         mark.visible = visible
-        marks.append(mark)
+        marks[i] = mark
+
+    # record the footprint geometry for the new marks
+    if marks:
+        _footprint_geometry[marks[0]] = geometry
 
     if update_patches is None:
-        fig.marks = fig.marks + marks
+        fig.marks = [*fig.marks, *marks]
     return marks
 
 
+def _figure_scales(fig):
+    """
+    Get the x and y scales for a figure's current interaction.
+
+    Scales are looked up once per figure interaction and reused
+    for later overlays.
+    """
+    interaction = fig.interaction
+    cached = _figure_scale_cache.get(fig)
+    if cached is None or cached[0] is not interaction:
+        scales = {"x": interaction.x_scale, "y": interaction.y_scale}
+        cached = (interaction, scales)
+        _figure_scale_cache[fig] = cached
+    return cached[1]
+
+
+def _footprint_regions(inst, ra, dec, pa, *, dither_pattern, add_mosaic, mosaic_offset):
+    """
+    Make sky regions for an instrument footprint.
+
+    Inputs are rounded before the cached footprint lookup, so that
+    nearly identical configurations share a cache entry.
+
+    Returns
+    -------
+    regs : regions.Regions
+        Footprint regions. These are shared with other callers
+        via the cache, so they must not be modified.
+    """
+    if mosaic_offset is not None:
+        mosaic_offset = tuple(
+            round(float(value), _FOOTPRINT_ARCSEC_DIGITS) for value in mosaic_offset
+        )
+    return _cached_footprint_regions(
+        inst,
+        round(float(ra), _FOOTPRINT_DEG_DIGITS),
+        round(float(dec), _FOOTPRINT_DEG_DIGITS),
+        round(float(pa), _FOOTPRINT_DEG_DIGITS),
+        dither_pattern=dither_pattern,
+        add_mosaic=add_mosaic,
+        mosaic_offset=mosaic_offset,
+    )
+
+
+@lru_cache(maxsize=128)
+def _cached_footprint_regions(
+    inst, ra, dec, pa, *, dither_pattern, add_mosaic, mosaic_offset
+):
+    """
+    Make sky regions for an instrument footprint.
+
+    Results are cached, so that returning to a previous instrument
+    configuration does not recompute the footprint. Returned regions
+    must not be modified.
+    """
+    if inst == "NIRSpec":
+        return fp.nirspec_footprint(ra, dec, pa)
+
+    # 'NIRCam Short' or 'NIRCam Long'
+    channel = inst.split()[-1].lower()
+    return fp.nircam_dither_footprint(
+        ra,
+        dec,
+        pa,
+        channel=channel,
+        dither_pattern=dither_pattern,
+        add_mosaic=add_mosaic,
+        mosaic_offset=mosaic_offset,
+    )
+
+
+def _set_footprint_style(mark, colors, fill, opacities, fill_opacities):
+    """Set display style for an existing footprint mark."""
+    mark.colors = colors
+    if isinstance(mark, bqplot.Scatter):
+        mark.default_opacities = opacities
+    else:
+        mark.fill = fill
+        mark.opacities = opacities
+        mark.fill_opacities = fill_opacities
+
+
+@lru_cache(maxsize=16)
+def _instrument_name(instrument):
+    """Standardize an input instrument name, once per distinct input."""
+    inst = _WHITESPACE.sub("_", instrument.strip().lower())
+    return INSTRUMENT_NAMES[inst]
+
+
+@lru_cache(maxsize=16)
+def _dither_name(dither_pattern):
+    """Standardize an input dither pattern name, once per distinct input."""
+    return str(dither_pattern).strip().upper()
+
+
+def _regions_to_pixel(regs, wcs):
+    """
+    Convert sky regions to pixel coordinates with a single WCS call.
+
+    Parameters
+    ----------
+    regs : regions.Regions
+        Point and polygon sky regions to convert.
+    wcs : astropy.wcs.WCS
+        WCS structure, used to translate sky coordinates to pixel positions.
+
+    Returns
+    -------
+    pixel_coords : list of tuple
+        For each region, a tuple of (is_point, x, y), where `is_point`
+        is True for point regions and x and y are pixel coordinate arrays.
+    """
+    # gather all region vertices in one sky coordinate array
+    is_point = []
+    coords = []
+    for reg in regs:
+        point = isinstance(reg, regions.PointSkyRegion)
+        is_point.append(point)
+        coords.append(reg.center if point else reg.vertices)
+    if len(coords) == 0:
+        return []
+
+    # world_to_pixel transforms to the WCS celestial frame as needed
+    x_all, y_all = wcs.world_to_pixel(concatenate(coords))
+
+    # split back into per-region arrays
+    offsets = np.cumsum([np.size(c) for c in coords])[:-1]
+    return list(zip(is_point, np.split(x_all, offsets), np.split(y_all, offsets)))
+
+
 def bqplot_catalog(
     fig, catalog_file, wcs, *, colors=None, visible=True, fill=False, alpha=1.0
 ):
@@ -264,8 +425,8 @@ def bqplot_catalog(
     ----------
     fig : bqplot.Figure
         The bqplot figure to add catalog overlays to.
-    catalog_file : str
-        Path to a .radec catalog file.
+    catalog_file : str, pathlib.Path, or file-like
+        Path to a .radec catalog file or an open file object.
     wcs : astropy.wcs.WCS
         WCS structure, used to translate sky coordinates to pixel positions
         in the displayed image.
@@ -288,44 +449,33 @@ def bqplot_catalog(
     if colors is None:
         colors = [DEFAULT_COLOR["Primary Sources"], DEFAULT_COLOR["Filler Sources"]]
 
-    # load the source catalog
-    try:
-        catalog = pd.read_csv(
-            catalog_file,
-            names=["ra", "dec", "flag"],
-            delim_whitespace=True,
-            usecols=[0, 1, 2],
-        )
-    except ValueError:
-        # if the catalog file is a file object, it may need to be rewound
-        # before reading again
-        with suppress(AttributeError):
-            catalog_file.seek(0)
-
-        catalog = pd.read_csv(
-            catalog_file, names=["ra", "dec"], delim_whitespace=True, usecols=[0, 1]
-        )
-        catalog["flag"] = "P"
-    finally:
-        with suppress(AttributeError):
-            catalog_file.seek(0)
-
-    if len(catalog.index) == 0:
-        msg = "Catalog file is empty."
-        raise ValueError(msg)
-
-    # sort by flag
-    filler = catalog["flag"] == "F"
-    primary = ~filler
+    # load the source catalog and convert to pixels, or reuse a
+    # previous result for the same catalog and WCS
+    cache_key = _catalog_key(catalog_file, wcs)
+    if cache_key in _catalog_pixels:
+        primary_x, primary_y, fill_x, fill_y = _catalog_pixels[cache_key]
+    else:
+        try:
+            ra_primary, dec_primary, ra_filler, dec_filler = fp.source_catalog_arrays(
+                catalog_file
+            )
+        finally:
+            # if the catalog file is a file object, it may need to be rewound
+            # before reading again
+            with suppress(AttributeError):
+                catalog_file.seek(0)
 
-    fill_x, fill_y = wcs.wcs_world2pix(catalog["ra"][filler], catalog["dec"][filler], 0)
+        fill_x, fill_y = wcs.wcs_world2pix(ra_filler, dec_filler, 0)
+        primary_x, primary_y = wcs.wcs_world2pix(ra_primary, dec_primary, 0)
 
-    primary_x, primary_y = wcs.wcs_world2pix(
-        catalog["ra"][primary], catalog["dec"][primary], 0
-    )
+        if cache_key is not None:
+            if len(_catalog_pixels) >= _CATALOG_CACHE_SIZE:
+                # drop the oldest entry
+                del _catalog_pixels[next(iter(_catalog_pixels))]
+            _catalog_pixels[cache_key] = (primary_x, primary_y, fill_x, fill_y)
 
     # get scales from figure
-    scales = {"x": fig.interaction.x_scale, "y": fig.interaction.y_scale}
+    scales = _figure_scales(fig)
 
     # scatter plot for primary markers
     primary_markers = bqplot.Scatter(
@@ -358,25 +508,71 @@ def bqplot_catalog(
     return primary_markers, filler_markers
 
 
+def _catalog_key(catalog_file, wcs):
+    """
+    Make a cache key for catalog pixel positions.
+
+    Paths are identified by their resolved name and modification time;
+    file objects by a hash of their contents, so that the cache holds
+    no reference to them. None is returned if the catalog cannot
+    be identified.
+    """
+    if isinstance(catalog_file, (str, os.PathLike)):
+        try:
+            path = Path(catalog_file).resolve()
+            source = (str(path), path.stat().st_mtime_ns)
+        except OSError:
+            return None
+    elif hasattr(catalog_file, "read"):
+        try:
+            position = catalog_file.tell()
+            content = catalog_file.read()
+            catalog_file.seek(position)
+        except (AttributeError, OSError):
+            return None
+        if isinstance(content, str):
+            content = content.encode()
+        source = hashlib.sha256(content).hexdigest()
+    else:
+        return None
+    return source, wcs.to_header_string()
+
+
+def _set_pa_label(change, *, inst, line, time_data, min_pa, max_pa):
+    """Update a timeline legend label for a new x-axis range."""
+    scale = change["owner"]
+    pa_label = _average_pa(time_data, min_pa, max_pa, scale.min, scale.max)
+    line.labels = [inst, pa_label]
+
+
+def _circmean_deg(angles, axis=None):
+    """Circular mean of angles in degrees, ignoring NaN values."""
+    rad = np.deg2rad(angles)
+    mean = np.rad2deg(
+        np.arctan2(np.nansum(np.sin(rad), axis=axis), np.nansum(np.cos(rad), axis=axis))
+    )
+
+    # mean is NaN if there are no valid values
+    return np.where(np.all(np.isnan(angles), axis=axis), np.nan, mean)
+
+
 def _average_pa(time_data, min_pa, max_pa, min_time=None, max_time=None, method="mean"):
     """Describe the average PA value within a specified time range."""
+    all_pa = np.array([min_pa, max_pa], dtype=np.float64)
     if min_time is not None and max_time is not None:
         in_range = (time_data >= min_time) & (time_data <= max_time)
-        all_pa = np.array([min_pa[in_range], max_pa[in_range]]) * u.deg
-    else:
-        all_pa = np.array([min_pa, max_pa]) * u.deg
+        all_pa = all_pa[:, in_range]
 
     if method == "mode":
         nnan = ~np.isnan(all_pa[0]) | ~np.isnan(all_pa[1])
         if np.sum(nnan) > 0:
-            all_pa = circmean(all_pa[:, nnan], axis=0).value
-            val, ct = np.unique(np.round(all_pa).astype(int), return_counts=True)
-            avg_pa = (val[ct.argmax()] + 360) % 360
+            all_pa = _circmean_deg(all_pa[:, nnan], axis=0)
+            rounded = np.round(all_pa).astype(np.intp) % 360
+            avg_pa = int(np.bincount(rounded, minlength=360).argmax())
         else:
             avg_pa = np.nan
     else:
-        nnan = ~np.isnan(all_pa)
-        avg_pa = (circmean(all_pa[nnan]).value + 360) % 360
+        avg_pa = float(_circmean_deg(all_pa) + 360) % 360
 
     if np.isnan(avg_pa):
         pa_label = "(not visible)"
@@ -471,12 +667,20 @@ def bqplot_timeline(
         )
         marks.append(message)
     else:
+        # get plain arrays for the time and angle columns, once
+        time_data = np.asarray(timeline_data["Time"])
+        pa_data = {
+            name: np.asarray(column, dtype=float)
+            for name, column in timeline_data.items()
+            if name != "Time"
+        }
+
         # add V3PA line if desired
         if show_v3pa and len(marks) == 0:
             color = DEFAULT_COLOR["V3PA"]
             line = bqplot.Lines(
-                x=timeline_data["Time"],
-                y=timeline_data["V3PA"],
+                x=time_data,
+                y=pa_data["V3PA"],
                 scales=scales,
                 colors=[color],
                 labels=["JWST V3 PA"],
@@ -490,11 +694,11 @@ def bqplot_timeline(
             else:
                 color = colors[i]
 
-            min_pa = timeline_data[f"{inst.upper()}_min_PA"]
-            max_pa = timeline_data[f"{inst.upper()}_max_PA"]
-            avg_pa = _average_pa(timeline_data["Time"], min_pa, max_pa)
+            min_pa = pa_data[f"{inst.upper()}_min_PA"]
+            max_pa = pa_data[f"{inst.upper()}_max_PA"]
+            avg_pa = _average_pa(time_data, min_pa, max_pa)
             line = bqplot.Lines(
-                x=timeline_data["Time"],
+                x=time_data,
                 y=[min_pa, max_pa],
                 scales=scales,
                 colors=[color],
@@ -506,28 +710,31 @@ def bqplot_timeline(
             marks.append(line)
 
             # add a little callback to update the legend with the
-            # average PA value in range, when the plot is zoomed
-            def _set_pa_label(inst_, line_, *args):
-                pa_label = _average_pa(
-                    timeline_data["Time"],
-                    timeline_data[f"{inst_.upper()}_min_PA"],
-                    timeline_data[f"{inst_.upper()}_max_PA"],
-                    scales["x"].min,
-                    scales["x"].max,
+            # average PA value in range, when the plot is zoomed;
+            # only the last change in a pan or zoom gesture is handled
+            callback = Debouncer(
+                partial(
+                    _set_pa_label,
+                    inst=inst,
+                    line=line,
+                    time_data=time_data,
+                    min_pa=min_pa,
+                    max_pa=max_pa,
                 )
-                line_.labels = [inst_, pa_label]
-
-            scales["x"].observe(partial(_set_pa_label, inst, line), names=["max"])
+            )
+            scales["x"].observe(callback, names=["max"])
+            _figure_callbacks.setdefault(fig, []).append((scales["x"], callback))
 
-    fig.title = title.rstrip(",")
-    fig.legend_location = "top-right"
-    fig.marks = marks
-    fig.axes = [
-        bqplot.Axis(scale=scales["x"], label="Date"),
-        bqplot.Axis(
-            scale=scales["y"], label="Position Angle (deg)", orientation="vertical"
-        ),
-    ]
+    with fig.hold_sync():
+        fig.title = title.rstrip(",")
+        fig.legend_location = "top-right"
+        fig.marks = marks
+        fig.axes = [
+            bqplot.Axis(scale=scales["x"], label="Date"),
+            bqplot.Axis(
+                scale=scales["y"], label="Position Angle (deg)", orientation="vertical"
+            ),
+        ]
 
 
 def remove_bqplot_patches(fig, patches):
@@ -541,20 +748,20 @@ def remove_bqplot_patches(fig, patches):
     patches : list of bqplot.Mark
         The patches to remove.
     """
-    marks = fig.marks.copy()
-    for patch in patches:
-        try:
-            marks.remove(patch)
-        except ValueError:
-            continue
-    fig.marks = marks
+    to_remove = {id(patch) for patch in patches}
+    fig.marks = [mark for mark in fig.marks if id(mark) not in to_remove]
 
 
 def clear_bqplot_figure(fig):
     """Clear a bqplot figure."""
-    fig.marks = []
-    fig.axes = []
-    fig.axis_registry = {}
+    # remove any scale observers set for the old marks
+    for scale, callback in _figure_callbacks.pop(fig, []):
+        scale.unobserve(callback, names=["max"])
+
+    with fig.hold_sync():
+        fig.marks = []
+        fig.axes = []
+        fig.axis_registry = {}
 
 
 class BqplotToolbar:
@@ -1,22 +1,50 @@
+import collections
 import contextlib
+import functools
+import json
+import math
+import re
+from pathlib import Path
 
 import ipyvuetify as v
 import ipywidgets as ipw
+import numpy as np
 import regions
 import yaml
-from traitlets import HasTraits, Unicode
+from astropy.coordinates import concatenate
+from traitlets import Bool, HasTraits, Unicode
 
 from jwst_novt import footprints as fp
 from jwst_novt.interact.utils import FileDownloadLink
 
+# use the libyaml emitter, if available
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:  # pragma: no cover
+    from yaml import SafeDumper as _YamlDumper
+
 __all__ = ["SaveOverlays"]
 
+# instrument or catalog tag in serialized region text
+_REGION_TAG = re.compile(r"tag=\{([^}]*)\}")
+
+# keys that may be written as plain YAML scalars
+_PLAIN_KEY = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+_RESERVED_KEYS = frozenset({"null", "true", "false", "yes", "no", "on", "off"})
+
+# string values that may be written as plain YAML scalars, if they
+# would not be read back as another type; others are quoted
+_PLAIN_VALUE = re.compile(r"[A-Za-z0-9_./()][A-Za-z0-9_ ./()+'-]*(?<! )")
+_YAML_RESOLVER = yaml.resolver.Resolver()
+_YAML_STR_TAG = "tag:yaml.org,2002:str"
+
 
 class SaveOverlays(HasTraits):
     """Widgets to save currently displayed overlay regions."""
 
     coordinates = Unicode("pixel coordinates").tag(sync=True)
     region_filename = Unicode("novt_overlays.reg").tag(sync=True)
+    compress_regions = Bool(default_value=False).tag(sync=True)
     config_filename = Unicode("novt_config.yaml").tag(sync=True)
 
     def __init__(self, show_overlays, *, allow_configuration=False):
@@ -28,6 +56,25 @@ class SaveOverlays(HasTraits):
         self.coord_options = ["pixel coordinates", "sky coordinates"]
         self.show_overlays = show_overlays
 
+        # recently made regions and region text, keyed by input settings
+        self._region_cache = collections.OrderedDict()
+        self._region_cache_size = 8
+
+        # settings for the current download link
+        self._link_state = None
+
+        # current colors and markers, reset when any color changes
+        self._style = None
+        for controls in (
+            show_overlays.nirspec_controls,
+            show_overlays.nircam_controls,
+            show_overlays.uploaded_data,
+        ):
+            if controls is not None:
+                controls.observe(
+                    self._reset_style, names=["color_primary", "color_alternate"]
+                )
+
         # make widgets to display
         self.set_format = ipw.Dropdown(
             description="Region file format",
@@ -37,18 +84,30 @@ class SaveOverlays(HasTraits):
         )
         self.set_coordinates = ipw.Dropdown(
             options=self.coord_options,
+            value=self.coordinates,
             style={"description_width": "initial"},
             tooltip="Coordinate system for overlay description",
         )
         self.set_filename = ipw.Text(
             description="Region file name",
+            value=self.region_filename,
             style={"description_width": "initial"},
             layout=ipw.Layout(width="300px"),
             tooltip="File name to assign to downloaded region file",
         )
 
+        self.set_compress = ipw.Checkbox(
+            description="Compress (gzip)",
+            value=self.compress_regions,
+            indent=False,
+            layout=ipw.Layout(width="auto", margin="0px 0px 0px 10px"),
+            tooltip="Download region file as a gzip archive",
+        )
+
+        # widgets start with the trait values, so linking sends no updates
         ipw.link((self, "coordinates"), (self.set_coordinates, "value"))
         ipw.link((self, "region_filename"), (self.set_filename, "value"))
+        ipw.link((self, "compress_regions"), (self.set_compress, "value"))
 
         # save buttons: one to make region file and update link to download,
         # another to trigger download
@@ -56,39 +115,18 @@ class SaveOverlays(HasTraits):
         self.make_file = v.Btn(
             color="primary", class_="mx-2 my-2", children=["Make region file"]
         )
-        self.file_link = FileDownloadLink(value="Download")
-        self.save_file = v.Btn(class_="mx-2 my-2", children=[self.file_link])
+        # the download link is its own button
+        self.file_link = FileDownloadLink("Download")
+        self.save_file = self.file_link
 
         self.make_file.on_event("click", self.make_regions)
-        self.save_file.on_event("click", self.file_link.clear_link)
-
-        if allow_configuration:
-            self.set_config_filename = ipw.Text(
-                description="Config file name",
-                style={"description_width": "initial"},
-                layout=ipw.Layout(width="300px"),
-                tooltip="File name to assign to downloaded configuration file",
-            )
-            ipw.link((self, "config_filename"), (self.set_config_filename, "value"))
 
-            self.make_config_file = v.Btn(
-                color="primary", class_="mx-2 my-2", children=["Make config file"]
-            )
-            self.config_file_link = FileDownloadLink(value="Download")
-            self.save_config_file = v.Btn(
-                class_="mx-2 my-2", children=[self.config_file_link]
-            )
-
-            self.make_config_file.on_event("click", self.make_config)
-            self.save_config_file.on_event("click", self.config_file_link.clear_link)
-        else:
-            self.set_config_filename = None
-            self.make_config_file = None
-            self.config_file_link = None
-            self.save_config_file = None
+        # configuration widgets are built on first use
+        self.allow_configuration = allow_configuration
+        self._config_widgets = None
 
         # layout widgets
-        button_layout = ipw.Layout(
+        self._button_layout = ipw.Layout(
             display="flex",
             flex_flow="row",
             align_items="center",
@@ -98,29 +136,83 @@ class SaveOverlays(HasTraits):
         box_layout = ipw.Layout(
             display="flex", flex_flow="column", align_items="stretch"
         )
-
         b1 = ipw.Box(
-            children=[self.set_format, self.set_coordinates], layout=button_layout
+            children=[self.set_format, self.set_coordinates, self.set_compress],
+            layout=self._button_layout,
         )
         b2 = ipw.Box(
             children=[self.set_filename, self.make_file, self.save_file],
-            layout=button_layout,
+            layout=self._button_layout,
         )
-        children = [b1, b2]
+        self._box = ipw.Box(children=[b1, b2], layout=box_layout)
+        self.widgets = ipw.Accordion(children=[self._box], titles=[self.title])
 
         if allow_configuration:
-            b3 = ipw.Box(
-                children=[
-                    self.set_config_filename,
-                    self.make_config_file,
-                    self.save_config_file,
-                ],
-                layout=button_layout,
-            )
-            children.append(b3)
+            self.widgets.observe(self._open_config_widgets, names="selected_index")
+
+    @property
+    def set_config_filename(self):
+        """ipywidgets.Text or None : Configuration file name entry."""
+        return self._get_config_widget("set_config_filename")
+
+    @property
+    def make_config_file(self):
+        """ipyvuetify.Btn or None : Button to make a configuration file."""
+        return self._get_config_widget("make_config_file")
+
+    @property
+    def config_file_link(self):
+        """FileDownloadLink or None : Configuration file download link."""
+        return self._get_config_widget("config_file_link")
+
+    @property
+    def save_config_file(self):
+        """ipyvuetify.Btn or None : Button to download a configuration file."""
+        return self._get_config_widget("save_config_file")
+
+    def _get_config_widget(self, name):
+        """Get a configuration widget, building them if needed."""
+        if not self.allow_configuration:
+            return None
+        if self._config_widgets is None:
+            self._build_config_widgets()
+        return self._config_widgets[name]
+
+    def _open_config_widgets(self, change):
+        """Build configuration widgets when the panel is first opened."""
+        if change["new"] is not None and self._config_widgets is None:
+            self._build_config_widgets()
+
+    def _build_config_widgets(self):
+        """Make configuration file widgets and add them to the layout."""
+        set_config_filename = ipw.Text(
+            description="Config file name",
+            value=self.config_filename,
+            style={"description_width": "initial"},
+            layout=ipw.Layout(width="300px"),
+            tooltip="File name to assign to downloaded configuration file",
+        )
+        ipw.link((self, "config_filename"), (set_config_filename, "value"))
 
-        box = ipw.Box(children=children, layout=box_layout)
-        self.widgets = ipw.Accordion(children=[box], titles=[self.title])
+        make_config_file = v.Btn(
+            color="primary", class_="mx-2 my-2", children=["Make config file"]
+        )
+        config_file_link = FileDownloadLink("Download")
+
+        make_config_file.on_event("click", self.make_config)
+
+        self._config_widgets = {
+            "set_config_filename": set_config_filename,
+            "make_config_file": make_config_file,
+            "config_file_link": config_file_link,
+            "save_config_file": config_file_link,
+        }
+
+        b3 = ipw.Box(
+            children=[set_config_filename, make_config_file, config_file_link],
+            layout=self._button_layout,
+        )
+        self._box.children = [*self._box.children, b3]
 
     def _make_nirspec_regions(self):
         """
@@ -151,22 +243,30 @@ class SaveOverlays(HasTraits):
         regions : regions.Regions
             New astropy region set.
         """
+        return fp.nircam_dither_footprint(channel=channel, **self._nircam_settings())
+
+    def _make_nircam_channel_regions(self):
+        """
+        Make NIRCam regions for both channels from current settings.
+
+        Returns
+        -------
+        regions : dict
+            Keys are 'short' and 'long'; values are new astropy region sets.
+        """
+        return fp.nircam_channel_footprints(**self._nircam_settings())
+
+    def _nircam_settings(self):
+        """Get footprint arguments from current NIRCam settings."""
         controls = self.show_overlays.nircam_controls
-        ra = controls.ra
-        dec = controls.dec
-        pa = controls.pa
-        dither_pattern = controls.dither
-        add_mosaic = controls.mosaic == "Yes"
-        mosaic_offset = (controls.mosaic_v2, controls.mosaic_v3)
-        return fp.nircam_dither_footprint(
-            ra,
-            dec,
-            pa,
-            channel=channel,
-            dither_pattern=dither_pattern,
-            add_mosaic=add_mosaic,
-            mosaic_offset=mosaic_offset,
-        )
+        return {
+            "ra": controls.ra,
+            "dec": controls.dec,
+            "pa": controls.pa,
+            "dither_pattern": controls.dither,
+            "add_mosaic": controls.mosaic == "Yes",
+            "mosaic_offset": (controls.mosaic_v2, controls.mosaic_v3),
+        }
 
     def _make_catalog_regions(self, cat_file):
         """
@@ -198,10 +298,14 @@ class SaveOverlays(HasTraits):
         if "primary" in cat_markers and cat_markers["primary"].visible:
             cat_regions["primary"] = primary
         if "filler" in cat_markers and cat_markers["filler"].visible:
-            cat_regions["filler"] = primary
+            cat_regions["filler"] = filler
 
         return cat_regions
 
+    def _reset_style(self, *args, **kwargs):
+        """Clear cached style settings after a color change."""
+        self._style = None
+
     def _get_style(self):
         """
         Get current style settings.
@@ -244,11 +348,13 @@ class SaveOverlays(HasTraits):
 
         # patch color and marker into text, based on tag
         # (regions package does not yet serialize style)
-        for inst, value in colors.items():
-            region_text = region_text.replace(
-                f"tag={{{inst}}}", f"tag={{{inst}}} color={value} point={markers[inst]}"
-            )
-        return region_text
+        def _add_style(match):
+            inst = match.group(1)
+            if inst not in colors:
+                return match.group(0)
+            return f"{match.group(0)} color={colors[inst]} point={markers[inst]}"
+
+        return _REGION_TAG.sub(_add_style, region_text)
 
     def make_regions(self, *args, **kwargs):
         """
@@ -268,41 +374,156 @@ class SaveOverlays(HasTraits):
         coord = self.set_coordinates.value
         file_format = self.set_format.value
 
-        colors, markers = self._get_style()
+        if self._style is None:
+            self._style = self._get_style()
+        colors, markers = self._style
+
+        # reuse regions if nothing has changed since the last call
+        signature = self._region_signature(wcs, coord, file_format, colors, markers)
+        if signature is not None and signature in self._region_cache:
+            self._region_cache.move_to_end(signature)
+            all_regions, region_text = self._region_cache[signature]
+        else:
+            all_regions, region_text = self._build_regions(
+                wcs, coord, file_format, colors, markers
+            )
+            if signature is not None:
+                self._region_cache[signature] = (all_regions, region_text)
+                if len(self._region_cache) > self._region_cache_size:
+                    self._region_cache.popitem(last=False)
+
+        if region_text is not None:
+            # the link only needs updating if it was cleared or
+            # its contents have changed
+            filename = self.set_filename.value
+            link_state = (signature, filename, self.compress_regions)
+            if (
+                signature is None
+                or link_state != self._link_state
+                or not self.file_link.url
+            ):
+                if self.compress_regions:
+                    filename = f"{filename}.gz"
+                self.file_link.edit_link(
+                    filename, region_text, compress=self.compress_regions
+                )
+                self._link_state = link_state
+
+        return all_regions
 
-        all_regions = []
-        for instrument in self.show_overlays.footprint_patches:
+    def _make_footprint_regions(self):
+        """
+        Make regions for all displayed footprints.
+
+        Returns
+        -------
+        footprint_regions : dict
+            Keys are instrument names, values are regions.Regions.
+        """
+        # if both NIRCam channels are shown, make them together
+        footprints = self.show_overlays.footprint_patches
+        nircam_regions = {}
+        if "NIRCam Short" in footprints and "NIRCam Long" in footprints:
+            nircam_regions = self._make_nircam_channel_regions()
+
+        footprint_regions = {}
+        for instrument in footprints:
             if instrument == "NIRSpec":
                 regs = self._make_nirspec_regions()
             else:
                 # 'NIRCam Short' or 'NIRCam Long'
                 channel = instrument.split()[-1].lower()
-                regs = self._make_nircam_regions(channel)
-
-            for region in regs:
-                region.meta["tag"] = [instrument]
-                region.style = {"color": colors[instrument]}
-                all_regions.append(region)
+                if channel in nircam_regions:
+                    regs = nircam_regions[channel]
+                else:
+                    regs = self._make_nircam_regions(channel)
+            footprint_regions[instrument] = regs
+        return footprint_regions
+
+    def _build_regions(self, wcs, coord, file_format, colors, markers):
+        """
+        Build regions and region file text from current displays.
 
+        Returns
+        -------
+        all_regions : regions.Regions
+            All created astropy regions.
+        region_text : str or None
+            Serialized region text, or None if there are no regions.
+        """
+        tagged_regions = self._make_footprint_regions()
         cat_file = self.show_overlays.uploaded_data.catalog_file
         if cat_file is not None:
-            cat_regions = self._make_catalog_regions(cat_file)
-            for cat_name in cat_regions:
-                for region in cat_regions[cat_name]:
-                    region.meta["tag"] = [cat_name]
-                    region.style = {"color": colors[cat_name]}
-                    all_regions.append(region)
+            tagged_regions.update(self._make_catalog_regions(cat_file))
+
+        # region counts are known: fill a preallocated list
+        all_regions = [None] * sum(len(regs) for regs in tagged_regions.values())
+        i = 0
+        for tag, regs in tagged_regions.items():
+            for region in regs:
+                region.meta["tag"] = [tag]
+                region.style = {"color": colors[tag]}
+                all_regions[i] = region
+                i += 1
 
         if coord == "pixel coordinates":
-            all_regions = [r.to_pixel(wcs) for r in all_regions]
+            all_regions = _to_pixel_regions(all_regions, wcs)
 
         all_regions = regions.Regions(all_regions)
+        region_text = None
         if len(all_regions) > 0:
             region_text = self._patch_style(all_regions, file_format, colors, markers)
-            filename = self.set_filename.value
-            self.file_link.edit_link(filename, region_text)
+        return all_regions, region_text
 
-        return all_regions
+    def _region_signature(self, wcs, coord, file_format, colors, markers):
+        """
+        Describe all inputs to the region file.
+
+        Returns
+        -------
+        signature : tuple or None
+            Hashable description of the current settings, or None if
+            the catalog file cannot be identified.
+        """
+        nirspec = self.show_overlays.nirspec_controls
+        nircam = self.show_overlays.nircam_controls
+        instruments = tuple(self.show_overlays.footprint_patches)
+
+        cat_file = self.show_overlays.uploaded_data.catalog_file
+        if cat_file is None:
+            cat_id = None
+        elif isinstance(cat_file, str):
+            try:
+                cat_id = (cat_file, Path(cat_file).stat().st_mtime_ns)
+            except OSError:
+                return None
+        else:
+            cat_id = cat_file["file_obj"]
+        cat_markers = self.show_overlays.catalog_markers
+        cat_visible = tuple(
+            (name, marker.visible) for name, marker in sorted(cat_markers.items())
+        )
+
+        return (
+            wcs,
+            coord,
+            file_format,
+            instruments,
+            (nirspec.ra, nirspec.dec, nirspec.pa),
+            (
+                nircam.ra,
+                nircam.dec,
+                nircam.pa,
+                nircam.dither,
+                nircam.mosaic,
+                nircam.mosaic_v2,
+                nircam.mosaic_v3,
+            ),
+            tuple(sorted(colors.items())),
+            tuple(sorted(markers.items())),
+            cat_id,
+            cat_visible,
+        )
 
     def make_config(self, *args, **kwargs):
         """
@@ -317,8 +538,151 @@ class SaveOverlays(HasTraits):
         if len(config) == 0:
             return None
 
-        config_str = yaml.dump(config)
+        config_str = _dump_config(config)
         filename = self.set_config_filename.value
         self.config_file_link.edit_link(filename, config_str)
 
         return config
+
+
+def _to_pixel_regions(sky_regions, wcs):
+    """
+    Convert sky regions to pixel regions with a single WCS call.
+
+    Parameters
+    ----------
+    sky_regions : list of regions.SkyRegion
+        Point and polygon sky regions to convert. Other region types
+        are converted individually.
+    wcs : astropy.wcs.WCS
+        WCS structure, used to translate sky coordinates to pixel positions.
+
+    Returns
+    -------
+    pixel_regions : list of regions.PixelRegion
+        Pixel regions, with metadata and visual attributes copied
+        from the input regions.
+    """
+    coords = []
+    for region in sky_regions:
+        if isinstance(region, regions.PointSkyRegion):
+            coords.append(region.center)
+        elif isinstance(region, regions.PolygonSkyRegion):
+            coords.append(region.vertices)
+        else:
+            return [r.to_pixel(wcs) for r in sky_regions]
+    if len(coords) == 0:
+        return []
+
+    # world_to_pixel transforms to the WCS celestial frame as needed
+    x_all, y_all = wcs.world_to_pixel(concatenate(coords))
+
+    pixel_regions = []
+    offsets = np.cumsum([np.size(c) for c in coords])[:-1]
+    for region, x, y in zip(
+        sky_regions, np.split(x_all, offsets), np.split(y_all, offsets)
+    ):
+        meta = region.meta.copy()
+        visual = region.visual.copy()
+        if isinstance(region, regions.PointSkyRegion):
+            pixel_region = regions.PointPixelRegion(
+                regions.PixCoord(x[0], y[0]), meta=meta, visual=visual
+            )
+        else:
+            pixel_region = regions.PolygonPixelRegion(
+                regions.PixCoord(x, y), meta=meta, visual=visual
+            )
+        pixel_regions.append(pixel_region)
+    return pixel_regions
+
+
+def _dump_config(config):
+    """
+    Write a configuration dictionary to YAML text.
+
+    Configurations are expected to contain sections of scalar values,
+    which are written directly. Any other structure is written with
+    PyYAML.
+
+    Parameters
+    ----------
+    config : dict
+        Configuration data, keyed by section name.
+
+    Returns
+    -------
+    config_str : str
+        YAML representation of the configuration.
+    """
+    lines = []
+    try:
+        for section in sorted(config):
+            lines.extend(_yaml_section(section, config[section]))
+    except TypeError:
+        return yaml.dump(config, Dumper=_YamlDumper)
+    return "\n".join(lines) + "\n"
+
+
+def _yaml_section(section, values):
+    """Format a YAML mapping of plain scalar values."""
+    if not isinstance(values, dict) or len(values) == 0:
+        raise TypeError
+    lines = [f"{_yaml_key(section)}:"]
+    for key in sorted(values):
+        lines.append(f"  {_yaml_key(key)}: {_yaml_scalar(values[key])}")
+    return lines
+
+
+def _yaml_key(key):
+    """Format a plain YAML mapping key."""
+    if (
+        not isinstance(key, str)
+        or key.lower() in _RESERVED_KEYS
+        or _PLAIN_KEY.fullmatch(key) is None
+    ):
+        raise TypeError
+    return key
+
+
+def _yaml_scalar(value):
+    """Format a YAML scalar value, readable by yaml.safe_load."""
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        return _yaml_float(value)
+    if isinstance(value, str):
+        return _yaml_str(value)
+    raise TypeError
+
+
+@functools.lru_cache(maxsize=128)
+def _yaml_str(value):
+    """Format a YAML string value, quoting it only if needed."""
+    if _PLAIN_VALUE.fullmatch(value) is not None:
+        tag = _YAML_RESOLVER.resolve(yaml.ScalarNode, value, (True, False))
+        if tag == _YAML_STR_TAG:
+            return value
+    if value.isprintable():
+        return "'" + value.replace("'", "''") + "'"
+
+    # JSON strings are valid double-quoted YAML scalars
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _yaml_float(value):
+    """Format a YAML float value."""
+    if math.isnan(value):
+        return ".nan"
+    if math.isinf(value):
+        return ".inf" if value > 0 else "-.inf"
+
+    # YAML floats need a decimal point
+    text = repr(float(value))
+    if "." not in text:
+        mantissa, exponent = text.split("e")
+        text = f"{mantissa}.0e{exponent}"
+    return text
@@ -1,10 +1,13 @@
 import contextlib
+import itertools
+from functools import partial
 
 import ipywidgets as ipw
 from jdaviz.core.events import SnackbarMessage
 
+from jwst_novt.constants import NO_MOSAIC
 from jwst_novt.interact import display as nd
-from jwst_novt.interact.utils import ToggleButton
+from jwst_novt.interact.utils import Debouncer, ToggleButton
 
 __all__ = ["ShowOverlays"]
 
@@ -25,6 +28,23 @@ class ShowOverlays:
         self.catalog_markers = {}
         self.footprint_patches = {}
 
+        # hidden footprints are kept for reuse, along with the
+        # settings that determine the number of patches
+        self._hidden_patches = {}
+        self._shape_keys = {}
+
+        # footprint redraws are debounced, so that a burst of control
+        # changes redraws each instrument only once
+        self._recreate = {"NIRSpec": False, "NIRCam": False}
+        self._redraw = {
+            name: Debouncer(
+                partial(self._redraw_footprint, name),
+                on_error=partial(self._report_redraw_error, name),
+                errors=(ValueError, TypeError),
+            )
+            for name in self._recreate
+        }
+
         # toggle catalog overlays
         self.catalog_buttons = []
         for name in self.catalogs:
@@ -51,12 +71,19 @@ class ShowOverlays:
         if self.nircam_controls is not None:
             self.instruments.extend(["NIRCam Short", "NIRCam Long"])
             self.nircam_controls.observe(
-                self.update_nircam_footprint,
-                names=["ra", "dec", "pa", "color_primary", "color_alternate", "alpha"],
-            )
-            self.nircam_controls.observe(self.update_nircam_dither, names=["dither"])
-            self.nircam_controls.observe(
-                self.update_nircam_mosaic, names=["mosaic", "mosaic_v2", "mosaic_v3"]
+                self._on_nircam_change,
+                names=[
+                    "ra",
+                    "dec",
+                    "pa",
+                    "color_primary",
+                    "color_alternate",
+                    "alpha",
+                    "dither",
+                    "mosaic",
+                    "mosaic_v2",
+                    "mosaic_v3",
+                ],
             )
 
         # toggle footprint overlays
@@ -81,21 +108,31 @@ class ShowOverlays:
 
     def clear_overlays(self, *args):
         """Remove existing catalog markers when a catalog file is loaded."""
-        # clear any old overlays on change in the image file
-        for instrument in self.footprint_patches:
-            nd.remove_bqplot_patches(
-                self.viewer.figure, self.footprint_patches[instrument]
+        # clear any old overlays on change in the image file,
+        # removing all footprint and catalog marks at once
+        old_patches = list(
+            itertools.chain(
+                *self.footprint_patches.values(),
+                *self._hidden_patches.values(),
+                self.catalog_markers.values(),
             )
+        )
         self.footprint_patches = {}
+        self._hidden_patches = {}
+        self.catalog_markers.clear()
 
-        for button in self.footprint_buttons:
-            if self.uploaded_data.has_wcs:
-                button.reset()
-            else:
-                button.disabled = True
+        with self.viewer.figure.hold_sync():
+            if old_patches:
+                nd.remove_bqplot_patches(self.viewer.figure, old_patches)
+
+            for button in self.footprint_buttons:
+                if self.uploaded_data.has_wcs:
+                    button.reset()
+                else:
+                    button.disabled = True
 
-        # also clear catalog
-        self.clear_catalog()
+            # also clear catalog
+            self.clear_catalog()
 
     def _load_catalog(self):
         """
@@ -146,16 +183,13 @@ class ShowOverlays:
     def clear_catalog(self, *args):
         """Remove existing catalog markers when a catalog file is loaded."""
         # clear any old markers on change in the catalog file
-        if "primary" in self.catalog_markers:
-            nd.remove_bqplot_patches(
-                self.viewer.figure, [self.catalog_markers["primary"]]
-            )
-            del self.catalog_markers["primary"]
-        if "filler" in self.catalog_markers:
-            nd.remove_bqplot_patches(
-                self.viewer.figure, [self.catalog_markers["filler"]]
-            )
-            del self.catalog_markers["filler"]
+        old_markers = [
+            self.catalog_markers.pop(name)
+            for name in ("primary", "filler")
+            if name in self.catalog_markers
+        ]
+        if old_markers:
+            nd.remove_bqplot_patches(self.viewer.figure, old_markers)
 
         # load catalog if it is available
         available = self._load_catalog()
@@ -198,23 +232,36 @@ class ShowOverlays:
                 controls = self.nirspec_controls
             else:
                 controls = self.nircam_controls
-            self._show_footprint([button.value], controls)
+
+            # reuse hidden patches if the number of patches is unchanged
+            instrument = button.value
+            patches = self._hidden_patches.pop(instrument, None)
+            if patches is None:
+                self._show_footprint([instrument], controls)
+            elif self._shape_keys.get(instrument) == self._shape_key(
+                instrument, controls
+            ):
+                self.footprint_patches[instrument] = patches
+                self._update_footprint([instrument], controls)
+            else:
+                nd.remove_bqplot_patches(self.viewer.figure, patches)
+                self._show_footprint([instrument], controls)
         else:
             button.toggle()
-            nd.remove_bqplot_patches(
-                self.viewer.figure, self.footprint_patches[button.value]
-            )
-            del self.footprint_patches[button.value]
+
+            # hide patches, keeping them for later reuse
+            patches = self.footprint_patches.pop(button.value)
+            with nd.hold_all_sync(patches):
+                for patch in patches:
+                    patch.visible = False
+            self._hidden_patches[button.value] = patches
 
     def all_patches(self):
         """Return all patches currently tracked."""
-        patches = []
-        for patch_set in self.footprint_patches.values():
-            for patch in patch_set:
-                patches.append(patch)
-        for patch in self.catalog_markers.values():
-            patches.append(patch)
-        return patches
+        return [
+            *itertools.chain.from_iterable(self.footprint_patches.values()),
+            *self.catalog_markers.values(),
+        ]
 
     def _show_footprint(self, instruments, controls):
         """
@@ -233,14 +280,15 @@ class ShowOverlays:
         if not self.uploaded_data.has_wcs:
             return
         wcs = self.viewer.state.reference_data.coords
-        with nd.hold_all_sync(self.all_patches()):
+        with nd.hold_all_sync(self.all_patches(), fig=self.viewer.figure):
+            # any old patches need to be removed first, all at once
+            old_patches = []
             for instrument in instruments:
-                # any old patches need to be removed first
-                if instrument in self.footprint_patches:
-                    nd.remove_bqplot_patches(
-                        self.viewer.figure, self.footprint_patches[instrument]
-                    )
+                old_patches.extend(self.footprint_patches.get(instrument, []))
+            if old_patches:
+                nd.remove_bqplot_patches(self.viewer.figure, old_patches)
 
+            for instrument in instruments:
                 # make new patches
                 if "long" in instrument.lower():
                     color = controls.color_alternate
@@ -260,6 +308,30 @@ class ShowOverlays:
                     add_mosaic=add_mosaic,
                     mosaic_offset=(controls.mosaic_v2, controls.mosaic_v3),
                 )
+                self._shape_keys[instrument] = self._shape_key(instrument, controls)
+
+    @staticmethod
+    def _shape_key(instrument, controls):
+        """
+        Describe the settings that determine the number of patches.
+
+        Parameters
+        ----------
+        instrument : str
+            The instrument name.
+        controls : jwst_novt.interact.ControlInstruments
+            Controls widgets associated with the instrument.
+
+        Returns
+        -------
+        key : tuple or None
+            Dither pattern and mosaic state for NIRCam instruments,
+            None for NIRSpec.
+        """
+        if "NIRS" in instrument:
+            return None
+        add_mosaic = controls.mosaic == "Yes" and controls.dither not in NO_MOSAIC
+        return controls.dither, add_mosaic
 
     def _update_footprint(self, instruments, controls):
         """
@@ -300,20 +372,73 @@ class ShowOverlays:
                         update_patches=self.footprint_patches.get(instrument),
                     )
 
+    def _schedule_redraw(self, name, *, recreate=False):
+        """
+        Schedule a footprint redraw for an instrument.
+
+        Parameters
+        ----------
+        name : {'NIRSpec', 'NIRCam'}
+            The instrument to redraw.
+        recreate : bool, optional
+            If set, apertures are recreated rather than updated in place
+            when the redraw runs.
+        """
+        self._recreate[name] = self._recreate[name] or recreate
+        self._redraw[name]()
+
+    def _redraw_footprint(self, name):
+        """Redraw footprints for an instrument after control changes."""
+        recreate = self._recreate[name]
+        self._recreate[name] = False
+        if name == "NIRSpec":
+            self._update_footprint(["NIRSpec"], self.nirspec_controls)
+        elif recreate:
+            # recreate apertures only if the number of patches changed
+            controls = self.nircam_controls
+            recreate, update = [], []
+            for inst in ["NIRCam Short", "NIRCam Long"]:
+                if inst in self.footprint_patches:
+                    if self._shape_keys.get(inst) == self._shape_key(inst, controls):
+                        update.append(inst)
+                    else:
+                        recreate.append(inst)
+            self._show_footprint(recreate, controls)
+            if update:
+                self._update_footprint(update, controls)
+        else:
+            instruments = ["NIRCam Short", "NIRCam Long"]
+            self._update_footprint(instruments, self.nircam_controls)
+
+    def _report_redraw_error(self, name, err):
+        """
+        Report an error from a deferred footprint redraw.
+
+        Deferred redraws run from the event loop rather than from a
+        widget callback, so their errors are reported to the user as a
+        message instead of being raised.
+        """
+        msg_text = f"Error updating {name} footprint: {err}"
+        msg = SnackbarMessage(msg_text, sender=self, color="warning")
+        self.viz.app.hub.broadcast(msg)
+
+    def _on_nircam_change(self, change):
+        """Dispatch a NIRCam control change to the matching update."""
+        name = change["name"]
+        if name == "dither":
+            self.update_nircam_dither()
+        elif name in ("mosaic", "mosaic_v2", "mosaic_v3"):
+            self.update_nircam_mosaic(change)
+        else:
+            self.update_nircam_footprint()
+
     def update_nircam_dither(self, *args):
         """Update NIRCam apertures after a dither pattern change."""
-        instruments = []
-        for inst in ["NIRCam Short", "NIRCam Long"]:
-            if inst in self.footprint_patches:
-                instruments.append(inst)
-        controls = self.nircam_controls
-        self._show_footprint(instruments, controls)
+        self._schedule_redraw("NIRCam", recreate=True)
 
     def update_nircam_footprint(self, *args):
         """Update NIRCam apertures after a center position or angle change."""
-        instruments = ["NIRCam Short", "NIRCam Long"]
-        controls = self.nircam_controls
-        self._update_footprint(instruments, controls)
+        self._schedule_redraw("NIRCam")
 
     def update_nircam_mosaic(self, change):
         """
@@ -323,19 +448,8 @@ class ShowOverlays:
         changes, and the apertures need to be recreated. Otherwise, the
         apertures are updated in place.
         """
-        instruments = []
-        for inst in ["NIRCam Short", "NIRCam Long"]:
-            if inst in self.footprint_patches:
-                instruments.append(inst)
-        controls = self.nircam_controls
-
-        if change["name"] == "mosaic":
-            self._show_footprint(instruments, controls)
-        else:
-            self._update_footprint(instruments, controls)
+        self._schedule_redraw("NIRCam", recreate=change["name"] == "mosaic")
 
     def update_nirspec_footprint(self, *args):
         """Update NIRSpec apertures in place."""
-        instruments = ["NIRSpec"]
-        controls = self.nirspec_controls
-        self._update_footprint(instruments, controls)
+        self._schedule_redraw("NIRSpec")
@@ -73,10 +73,8 @@ class ShowTimeline(HasTraits):
         )
         ipw.link((self, "instrument"), (self.set_instrument, "value"))
 
-        # re-make plot if instrument or dates change
-        self.set_start.observe(self._make_timeline, "value")
-        self.set_end.observe(self._make_timeline, "value")
-        self.set_instrument.observe(self._make_timeline, "value")
+        # plot update observers are attached when the plot is shown
+        self._observers_attached = False
 
         # make/save/close plot
         self.make_plot = v.Btn(
@@ -94,9 +92,6 @@ class ShowTimeline(HasTraits):
         )
         self.close_plot.on_event("click", self._clear_plot)
 
-        # link color changes to plot update
-        self.observe(self._update_colors, names=["nirspec_color", "nircam_color"])
-
         # clear plot if center object changes
         self.observe(self._clear_plot, names=["center"])
 
@@ -119,8 +114,29 @@ class ShowTimeline(HasTraits):
         box = ipw.Box(children=[b1, b2, self.figure_container], layout=box_layout)
         self.widgets = ipw.Accordion(children=[box], titles=[self.title])
 
+    def _attach_plot_observers(self):
+        """Re-make or recolor the plot when its controls change."""
+        if self._observers_attached:
+            return
+        self.set_start.observe(self._make_timeline, "value")
+        self.set_end.observe(self._make_timeline, "value")
+        self.set_instrument.observe(self._make_timeline, "value")
+        self.observe(self._update_colors, names=["nirspec_color", "nircam_color"])
+        self._observers_attached = True
+
+    def _detach_plot_observers(self):
+        """Stop updating the plot when its controls change."""
+        if not self._observers_attached:
+            return
+        self.set_start.unobserve(self._make_timeline, "value")
+        self.set_end.unobserve(self._make_timeline, "value")
+        self.set_instrument.unobserve(self._make_timeline, "value")
+        self.unobserve(self._update_colors, names=["nirspec_color", "nircam_color"])
+        self._observers_attached = False
+
     def _clear_plot(self, *args, **kwargs):
         """Clear and hide the current figure."""
+        self._detach_plot_observers()
         if self.figure is not None:
             nd.clear_bqplot_figure(self.figure)
         self.figure_container.children = []
@@ -191,6 +207,7 @@ class ShowTimeline(HasTraits):
         # center toolbar
         self.figure_container.children = [self.figure, self.toolbar]
         self._make_timeline()
+        self._attach_plot_observers()
 
     def _update_colors(self, *args, **kwargs):
         """Update colors in the current plot."""
@@ -1,5 +1,3 @@
-import copy
-
 import ipywidgets as ipw
 from traitlets import TraitError
 
@@ -50,6 +48,18 @@ class StyleApplication:
             (self.uploaded_data, "image_file_name"), (self.timeline_controls, "center")
         )
 
+        # controls for each configuration section, and the reverse
+        self._config_controls = {
+            "nirspec": self.nirspec_controls,
+            "nircam": self.nircam_controls,
+            "catalog": self.uploaded_data,
+            "timeline": self.timeline_controls,
+            "save": self.save_controls,
+        }
+        self._config_sections = {
+            control: section for section, control in self._config_controls.items()
+        }
+
         # link configuration upload to controls
         self.uploaded_data.observe(self.update_from_config, "configuration")
 
@@ -146,37 +156,44 @@ class StyleApplication:
 
     def update_from_config(self, *args, **kwargs):
         """Update control values from input configuration."""
-        config = copy.deepcopy(self.uploaded_data.configuration)
-
-        controls = {
-            "nirspec": self.nirspec_controls,
-            "nircam": self.nircam_controls,
-            "catalog": self.uploaded_data,
-            "timeline": self.timeline_controls,
-            "save": self.save_controls,
+        # configured values are scalars, so a copy of each section is
+        # enough to guard against updates to the configuration while
+        # values are applied
+        config = {
+            section: dict(values)
+            for section, values in self.uploaded_data.configuration.items()
         }
-        for section in config:
-            for key, value in config[section].items():
-                control = controls[section]
-                if control.has_trait(key):
-                    try:
-                        setattr(control, key, value)
-                    except (AttributeError, ValueError, TypeError, TraitError):
-                        continue
+
+        controls = self._config_controls
+
+        # hold notifications for each control until its values are set,
+        # so its observers run once per changed value, with all new
+        # values in place
+        for section, values in config.items():
+            control = controls[section]
+            try:
+                with control.hold_trait_notifications():
+                    _set_config_values(control, values)
+            except TraitError:
+                # a held value failed validation and all were rolled
+                # back: set them one at a time, skipping any bad values
+                _set_config_values(control, values)
 
     def update_to_config(self, change):
         """Update configuration dictionary from changed control values."""
-        config = self.uploaded_data.configuration
-        sections = {
-            "nirspec": self.nirspec_controls,
-            "nircam": self.nircam_controls,
-            "catalog": self.uploaded_data,
-            "timeline": self.timeline_controls,
-            "save": self.save_controls,
-        }
-        for section, control in sections.items():
-            if change["owner"] is control and change["name"] in CONFIGURABLE[section]:
-                # check for whitelisted names
-                if section not in config:
-                    config[section] = {}
-                config[section][change["name"]] = change["new"]
+        section = self._config_sections.get(change["owner"])
+
+        # check for whitelisted names
+        if section is not None and change["name"] in CONFIGURABLE[section]:
+            config = self.uploaded_data.configuration
+            config.setdefault(section, {})[change["name"]] = change["new"]
+
+
+def _set_config_values(control, values):
+    """Set configured values on a control, skipping any that fail."""
+    for key, value in values.items():
+        if control.has_trait(key):
+            try:
+                setattr(control, key, value)
+            except (AttributeError, ValueError, TypeError, TraitError):
+                continue
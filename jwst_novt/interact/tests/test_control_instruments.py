@@ -1,5 +1,8 @@
+import asyncio
+
 import numpy as np
 import pytest
+from astropy.nddata import NDData
 
 try:
     import ipywidgets as ipw
@@ -46,12 +49,18 @@ class TestControlInstrument:
             "widgets",
             "set_dither",
             "set_mosaic",
-            "set_mosaic_v2",
-            "set_mosaic_v3",
         ]
         for widget in controls:
             assert isinstance(getattr(ci, widget), ipw.Widget)
 
+        # mosaic offset widgets are created when mosaic is turned on
+        offset_controls = ["set_mosaic_v2", "set_mosaic_v3"]
+        for widget in offset_controls:
+            assert getattr(ci, widget) is None
+        ci.mosaic = "Yes"
+        for widget in offset_controls:
+            assert isinstance(getattr(ci, widget), ipw.Widget)
+
         n_inst = 2
         assert len(ci.color_pickers) == n_inst
         assert isinstance(ci.color_pickers[0], ipw.Widget)
@@ -77,6 +86,12 @@ class TestControlInstrument:
         assert ci.pa == expected
         assert ci.set_pa.value == expected
 
+        # trait values are also wrapped when set directly
+        expected = 40
+        ci.pa = 400
+        assert ci.pa == expected
+        assert ci.set_pa.value == expected
+
     def test_set_from_wcs(self, imviz, loaded_imviz):
         ci = u.ControlInstruments("test", imviz)
         assert ci.ra == 0
@@ -98,6 +113,18 @@ class TestControlInstrument:
         assert np.allclose(ci.ra, 202.4695898)
         assert np.allclose(ci.dec, 47.1951868)
 
+    def test_set_from_wcs_on_load(self, imviz, image_2d_wcs):
+        ci = u.ControlInstruments("test", imviz)
+
+        # with an event loop running, ra and dec are set as soon as
+        # the data is loaded
+        async def load():
+            imviz.load_data(NDData(np.ones((10, 10)), wcs=image_2d_wcs))
+            return ci.ra, ci.dec
+
+        expected_ra, expected_dec = 202.4695898, 47.1951868
+        assert asyncio.run(load()) == (expected_ra, expected_dec)
+
     def test_check_mosaic_from_dither(self, imviz):
         ci = u.ControlInstruments("NIRCam", imviz)
 
@@ -105,8 +132,8 @@ class TestControlInstrument:
         ci.mosaic = "No"
         ci._check_mosaic_from_dither({"new": "FULL3"})
         assert not ci.set_mosaic.disabled
-        assert ci.set_mosaic_v2.disabled
-        assert ci.set_mosaic_v3.disabled
+        assert ci.set_mosaic_v2 is None
+        assert ci.set_mosaic_v3 is None
 
         ci.mosaic = "Yes"
         ci._check_mosaic_from_dither({"new": "FULL3"})
@@ -129,11 +156,31 @@ class TestControlInstrument:
     def test_check_mosaic(self, imviz):
         ci = u.ControlInstruments("NIRCam", imviz)
 
-        # check mosaic on/off
+        # check mosaic on/off: offset widgets are not created
+        # until mosaic is turned on
         ci._check_mosaic({"new": "No"})
-        assert ci.set_mosaic_v2.disabled
-        assert ci.set_mosaic_v3.disabled
+        assert ci.set_mosaic_v2 is None
+        assert ci.set_mosaic_v3 is None
 
         ci._check_mosaic({"new": "Yes"})
         assert not ci.set_mosaic_v2.disabled
         assert not ci.set_mosaic_v3.disabled
+
+        ci._check_mosaic({"new": "No"})
+        assert ci.set_mosaic_v2.disabled
+        assert ci.set_mosaic_v3.disabled
+
+    def test_mosaic_offset_layout(self, imviz):
+        ci = u.ControlInstruments("NIRCam", imviz)
+        ci.mosaic_v2 = 20.0
+
+        # offset widgets are added to the layout when created
+        assert isinstance(ci.widgets, ipw.Widget)
+        mosaic_fields = ci._mosaic_fields
+        assert mosaic_fields.children == (ci.set_mosaic,)
+        ci.mosaic = "Yes"
+        assert ci.set_mosaic_v2 in mosaic_fields.children
+        assert ci.set_mosaic_v3 in mosaic_fields.children
+
+        # current trait values are kept
+        assert ci.set_mosaic_v2.value == ci.mosaic_v2
@@ -1,5 +1,8 @@
+import io
 from contextlib import contextmanager
+from pathlib import Path
 
+import numpy as np
 import pytest
 from astropy.time import Time
 from astropy.wcs import WCS
@@ -17,6 +20,7 @@ except ImportError:
 else:
     HAS_DISPLAY = True
 
+from jwst_novt import footprints as fp
 from jwst_novt.constants import DEFAULT_COLOR
 
 
@@ -69,6 +73,12 @@ class TestDisplay:
         capt = capsys.readouterr().out
         assert capt == expected
 
+        # figure sync is held outside all marks
+        with u.hold_all_sync(marks[1:], fig=marks[0]):
+            print("done")
+        capt = capsys.readouterr().out
+        assert capt == expected
+
     def test_bqplot_figure(self):
         fig = u.bqplot_figure(toolbar=False)
         assert isinstance(fig, bqplot.Figure)
@@ -115,6 +125,14 @@ class TestDisplay:
             else:
                 assert isinstance(mark, bqplot.Scatter)
 
+        # if the position changes, patch coordinates are updated
+        old_x = fp_marks[0].x.copy()
+        new_marks = u.bqplot_footprint(
+            fig, "nirspec", ra + 0.01, dec, pa, wcs, update_patches=fp_marks
+        )
+        assert new_marks[0] is fp_marks[0]
+        assert new_marks[0].x[0] != old_x[0]
+
     def test_bqplot_footprint_mosaic(self, loaded_imviz):
         ra = 202.4695898
         dec = 47.1951868
@@ -159,6 +177,52 @@ class TestDisplay:
         assert isinstance(fp_marks, list)
         assert len(fp_marks) == 2 * 3 * (expected_patches - 1) + 1
 
+    def test_footprint_regions_cache(self):
+        kwargs = {"dither_pattern": "FULL3", "add_mosaic": True}
+        ra, dec, pa = 202.4695898, 47.1951868, 25.0
+
+        # nearly identical inputs share a cache entry
+        regs = u._footprint_regions(
+            "NIRCam Short", ra, dec, pa, mosaic_offset=(20.0, 20.0), **kwargs
+        )
+        same = u._footprint_regions(
+            "NIRCam Short",
+            ra + 1e-10,
+            dec - 1e-10,
+            pa + 1e-10,
+            mosaic_offset=[20.00001, 20.0],
+            **kwargs,
+        )
+        assert same is regs
+
+        # a real change makes new regions
+        moved = u._footprint_regions(
+            "NIRCam Short", ra + 1e-6, dec, pa, mosaic_offset=(20.0, 20.0), **kwargs
+        )
+        assert moved is not regs
+
+    @pytest.mark.parametrize("wcs_name", ["image_2d_wcs", "galactic_wcs"])
+    def test_regions_to_pixel(self, request, wcs_name):
+        wcs = request.getfixturevalue(wcs_name)
+        regs = fp.nircam_dither_footprint(
+            202.4695898, 47.1951868, 25.0, dither_pattern="FULL3"
+        )
+
+        # batched conversion matches per-region conversion in any sky frame
+        pixel_coords = u._regions_to_pixel(regs, wcs)
+        assert len(pixel_coords) == len(regs)
+        for reg, (is_point, x, y) in zip(regs, pixel_coords):
+            pix = reg.to_pixel(wcs)
+            if is_point:
+                assert np.allclose(x, pix.center.x)
+                assert np.allclose(y, pix.center.y)
+            else:
+                assert np.allclose(x, pix.vertices.x)
+                assert np.allclose(y, pix.vertices.y)
+
+        # no regions: no coordinates
+        assert u._regions_to_pixel([], wcs) == []
+
     def test_bqplot_catalog(self, loaded_imviz, catalog_file):
         fig = loaded_imviz.default_viewer._obj.figure
         wcs = loaded_imviz.default_viewer._obj.state.reference_data.coords
@@ -179,6 +243,45 @@ class TestDisplay:
         assert cat_marks[0].colors == ["red"]
         assert cat_marks[1].colors == ["blue"]
 
+    def test_bqplot_catalog_cache(self, mocker, loaded_imviz, catalog_file):
+        fig = loaded_imviz.default_viewer._obj.figure
+        wcs = loaded_imviz.default_viewer._obj.state.reference_data.coords
+        cat_marks = u.bqplot_catalog(fig, catalog_file, wcs)
+
+        # catalog is not read again for the same file and wcs
+        m1 = mocker.patch.object(u.fp, "source_catalog_arrays")
+        new_marks = u.bqplot_catalog(fig, catalog_file, wcs)
+        m1.assert_not_called()
+        assert np.allclose(new_marks[0].x, cat_marks[0].x)
+        assert np.allclose(new_marks[1].y, cat_marks[1].y)
+
+    def test_bqplot_catalog_cache_file_object(
+        self, mocker, loaded_imviz, catalog_file, catalog_file_2col
+    ):
+        fig = loaded_imviz.default_viewer._obj.figure
+        wcs = loaded_imviz.default_viewer._obj.state.reference_data.coords
+        upload = io.BytesIO(Path(catalog_file).read_bytes())
+        u.bqplot_catalog(fig, upload, wcs)
+
+        # uploads are keyed on content, not held by the cache
+        assert all(key[0] is not upload for key in u._catalog_pixels)
+
+        # the same content is not read again
+        spy = mocker.spy(u.fp, "source_catalog_arrays")
+        u.bqplot_catalog(fig, io.BytesIO(upload.getvalue()), wcs)
+        spy.assert_not_called()
+
+        # a rewritten buffer is read again
+        upload.seek(0)
+        upload.truncate()
+        upload.write(Path(catalog_file_2col).read_bytes())
+        upload.seek(0)
+        marks = u.bqplot_catalog(fig, upload, wcs)
+        spy.assert_called_once()
+        n_pri, n_fill = 7, 0
+        assert marks[0].x.size == n_pri
+        assert marks[1].x.size == n_fill
+
     def test_bqplot_catalog_errors(self, loaded_imviz, tmp_path, catalog_file_2col):
         fig = loaded_imviz.default_viewer._obj.figure
         wcs = loaded_imviz.default_viewer._obj.state.reference_data.coords
@@ -328,6 +431,13 @@ class TestDisplay:
         fig.axes[0].scale.max = Time("2022-01-04").to_datetime()
         assert fig.marks[0].labels == ["NIRSpec", "(not visible)"]
 
+        # callback is removed when the figure is cleared
+        line = fig.marks[0]
+        scale = fig.axes[0].scale
+        u.clear_bqplot_figure(fig)
+        scale.max = Time("2022-01-09").to_datetime()
+        assert line.labels == ["NIRSpec", "(not visible)"]
+
     def test_remove_bqplot_patches(self):
         # add some marks to a figure
         fig = bqplot.Figure()
@@ -1,16 +1,26 @@
+import base64
+import gzip
+
+import numpy as np
 import pytest
+import regions
+import yaml
 
 try:
     import ipywidgets as ipw
 
     from jwst_novt.interact import save_overlays as u
+    from jwst_novt.interact import utils
 except ImportError:
     ipw = None
     u = None
+    utils = None
     HAS_DISPLAY = False
 else:
     HAS_DISPLAY = True
 
+from jwst_novt import footprints as fp
+
 
 @pytest.mark.skipif(not HAS_DISPLAY, reason="Missing optional dependencies")
 class TestSaveOverlays:
@@ -83,6 +93,123 @@ class TestSaveOverlays:
         so.file_link.clear_link()
         assert not so.file_link.url
 
+    def test_compress_regions(self, overlay_controls):
+        so = u.SaveOverlays(overlay_controls)
+
+        # turn on a nirspec overlay
+        button = overlay_controls.footprint_buttons[0]
+        overlay_controls.toggle_footprint(button, None, None)
+        so.make_regions()
+        plain = so.file_link.url
+        assert plain.startswith("data:text/plain")
+
+        # compressed link holds the same region text
+        so.compress_regions = True
+        so.make_regions()
+        compressed = so.file_link.url
+        assert compressed.startswith("data:application/gzip")
+        assert so.file_link.attributes["download"] == f"{so.region_filename}.gz"
+        assert len(compressed) < len(plain)
+
+        text = base64.b64decode(plain.split(",")[1])
+        gz_text = gzip.decompress(base64.b64decode(compressed.split(",")[1]))
+        assert gz_text == text
+
+    def test_region_link_reuse(self, mocker, overlay_controls):
+        so = u.SaveOverlays(overlay_controls)
+        button = overlay_controls.footprint_buttons[0]
+        overlay_controls.toggle_footprint(button, None, None)
+
+        m1 = mocker.patch.object(utils, "encode_data", wraps=utils.encode_data)
+        so.make_regions()
+        url = so.file_link.url
+        assert m1.call_count == 1
+
+        # region text is encoded once, even after the link is cleared
+        so.file_link.clear_link()
+        so.make_regions()
+        assert so.file_link.url == url
+        assert m1.call_count == 1
+
+        # changing compression re-encodes
+        so.compress_regions = True
+        so.make_regions()
+        assert so.file_link.url.startswith("data:application/gzip")
+        n_encode = 2
+        assert m1.call_count == n_encode
+
+    def test_style_cache(self, overlay_controls):
+        so = u.SaveOverlays(overlay_controls)
+        button = overlay_controls.footprint_buttons[0]
+        overlay_controls.toggle_footprint(button, None, None)
+
+        so.make_regions()
+        style = so._style
+        assert style[0]["NIRSpec"] == overlay_controls.nirspec_controls.color_primary
+
+        # style is reused until a color changes
+        so.make_regions()
+        assert so._style is style
+        overlay_controls.nirspec_controls.color_primary = "green"
+        assert so._style is None
+        so.make_regions()
+        assert so._style[0]["NIRSpec"] == "green"
+
+    def test_make_catalog_regions(self, overlay_controls):
+        so = u.SaveOverlays(overlay_controls)
+
+        # turn on catalog overlays
+        overlay_controls._load_catalog()
+        for button in overlay_controls.catalog_buttons:
+            overlay_controls.toggle_catalog(button, None, None)
+
+        # primary and filler sources are tagged separately
+        all_regions = so.make_regions()
+        tags = [region.meta["tag"][0] for region in all_regions]
+        expected_primary, expected_filler = 2, 5
+        assert tags.count("primary") == expected_primary
+        assert tags.count("filler") == expected_filler
+
+    @pytest.mark.parametrize("wcs_name", ["image_2d_wcs", "galactic_wcs"])
+    def test_to_pixel_regions(self, request, wcs_name):
+        wcs = request.getfixturevalue(wcs_name)
+        sky_regions = list(
+            fp.nircam_dither_footprint(
+                202.4695898, 47.1951868, 25.0, dither_pattern="FULL3"
+            )
+        )
+        for region in sky_regions:
+            region.meta["tag"] = ["nircam"]
+
+        # batched conversion matches per-region conversion in any sky frame
+        pixel_regions = u._to_pixel_regions(sky_regions, wcs)
+        assert len(pixel_regions) == len(sky_regions)
+        for region, pixel_region in zip(sky_regions, pixel_regions):
+            expected = region.to_pixel(wcs)
+            assert type(pixel_region) is type(expected)
+            assert pixel_region.meta["tag"] == ["nircam"]
+            if isinstance(expected, regions.PointPixelRegion):
+                assert np.allclose(pixel_region.center.xy, expected.center.xy)
+            else:
+                assert np.allclose(pixel_region.vertices.x, expected.vertices.x)
+                assert np.allclose(pixel_region.vertices.y, expected.vertices.y)
+
+    def test_config_widgets(self, overlay_controls):
+        # no config widgets if not allowed
+        so = u.SaveOverlays(overlay_controls)
+        assert so.save_config_file is None
+        n_boxes = 2
+        assert len(so.widgets.children[0].children) == n_boxes
+
+        # config widgets are built when the panel is opened
+        so = u.SaveOverlays(overlay_controls, allow_configuration=True)
+        assert so._config_widgets is None
+        assert len(so.widgets.children[0].children) == n_boxes
+        so.widgets.selected_index = 0
+        assert so._config_widgets is not None
+        assert len(so.widgets.children[0].children) == n_boxes + 1
+        assert so.set_config_filename.value == so.config_filename
+
     def test_save_config(self, overlay_controls):
         so = u.SaveOverlays(overlay_controls, allow_configuration=True)
         assert so.save_config_file is not None
@@ -110,6 +237,40 @@ class TestSaveOverlays:
         more_values = so.config_file_link.url
         assert len(more_values) > len(one_value)
 
+        # download button links to the data
+        assert so.save_config_file.href == more_values
+        assert so.save_config_file.attributes["download"] == so.config_filename
+        assert not so.save_config_file.disabled
+
         # link is cleared after clicking on it
-        so.config_file_link.clear_link()
+        so.config_file_link.fire_event("click", None)
         assert not so.config_file_link.url
+        assert so.save_config_file.href is None
+        assert so.save_config_file.disabled
+
+    def test_dump_config(self):
+        config = {
+            "nirspec": {"ra": 100.0, "pa": 1e-05, "color_primary": "#ff0000"},
+            "nircam": {"mosaic": "No", "dither": "NONE", "alpha": float("inf")},
+            "timeline": {"start_date": "2022-01-01", "end_date": None},
+        }
+        config_str = u._dump_config(config)
+        assert yaml.safe_load(config_str) == config
+
+        # strings are quoted only where yaml would quote them
+        config = {
+            "nirspec": {
+                "color_primary": "#ff0000",
+                "coordinates": "sky coordinates",
+                "source_catalog": "it's a file",
+            },
+            "nircam": {"mosaic": "Yes", "dither": "FULL3", "date": "2022-01-01"},
+        }
+        config_str = u._dump_config(config)
+        assert yaml.safe_load(config_str) == config
+        assert config_str == yaml.dump(config)
+
+        # unsupported structures are written by yaml
+        config = {"nirspec": {"ra": [100.0, 101.0]}}
+        config_str = u._dump_config(config)
+        assert yaml.safe_load(config_str) == config
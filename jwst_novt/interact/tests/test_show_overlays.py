@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 try:
@@ -141,9 +143,19 @@ class TestShowOverlays:
         overlay_controls.toggle_footprint(button, None, None)
         assert button.is_active()
 
-        # footprint should be removed
+        # footprint should be hidden
+        assert inst not in overlay_controls.footprint_patches
+        assert patches[0] in overlay_controls.viewer.figure.marks
+        assert not patches[0].visible
+
+        # toggle on again: same patches are shown
+        overlay_controls.toggle_footprint(button, None, None)
+        assert overlay_controls.footprint_patches[inst] is patches
+        assert patches[0].visible
+
+        # toggle off again
+        overlay_controls.toggle_footprint(button, None, None)
         assert inst not in overlay_controls.footprint_patches
-        assert patches[0] not in overlay_controls.viewer.figure.marks
 
         # if no wcs is available, footprint is not created,
         # button stays active
@@ -152,6 +164,20 @@ class TestShowOverlays:
         assert button.is_active()
         assert inst not in overlay_controls.footprint_patches
 
+    def test_toggle_footprint_new_shape(self, overlay_controls):
+        button = overlay_controls.footprint_buttons[1]
+        overlay_controls.toggle_footprint(button, None, None)
+        patches = overlay_controls.footprint_patches["NIRCam Short"]
+        overlay_controls.toggle_footprint(button, None, None)
+
+        # dither changes while hidden: patches are recreated when shown
+        overlay_controls.nircam_controls.dither = "FULL3"
+        overlay_controls.toggle_footprint(button, None, None)
+        new_patches = overlay_controls.footprint_patches["NIRCam Short"]
+        assert len(new_patches) > len(patches)
+        assert patches[0] not in overlay_controls.viewer.figure.marks
+        assert new_patches[0] in overlay_controls.viewer.figure.marks
+
     def test_all_patches(self, overlay_controls):
         # no patches yet
         patches = overlay_controls.all_patches()
@@ -301,6 +327,46 @@ class TestShowOverlays:
         assert m1.call_count == 1
         assert m2.call_count == 1
 
+    def test_update_debounced(self, mocker, overlay_controls):
+        # with an event loop running, a burst of changes redraws once
+        m1 = mocker.patch.object(overlay_controls, "_show_footprint")
+        m2 = mocker.patch.object(overlay_controls, "_update_footprint")
+        overlay_controls.footprint_patches["NIRCam Short"] = ["test"]
+
+        async def burst():
+            overlay_controls.update_nircam_footprint()
+            overlay_controls.update_nircam_mosaic({"name": "mosaic"})
+            overlay_controls.update_nircam_mosaic({"name": "mosaic_v2"})
+            overlay_controls.update_nirspec_footprint()
+            await asyncio.sleep(0.3)
+
+        asyncio.run(burst())
+
+        # nircam is recreated once, since the mosaic changed
+        m1.assert_called_once_with(["NIRCam Short"], overlay_controls.nircam_controls)
+        m2.assert_called_once_with(["NIRSpec"], overlay_controls.nirspec_controls)
+
+    def test_update_error(self, mocker, overlay_controls):
+        # errors in a deferred redraw are reported as a message
+        mocker.patch.object(
+            overlay_controls, "_update_footprint", side_effect=ValueError("bad")
+        )
+        m1 = mocker.patch.object(overlay_controls.viz.app.hub, "broadcast")
+
+        async def update():
+            overlay_controls.update_nirspec_footprint()
+            await asyncio.sleep(0.3)
+
+        asyncio.run(update())
+        m1.assert_called_once()
+        assert "Error updating NIRSpec footprint: bad" in m1.call_args[0][0].text
+
+        # without an event loop, the redraw runs directly and errors are raised
+        m1.reset_mock()
+        with pytest.raises(ValueError, match="bad"):
+            overlay_controls.update_nirspec_footprint()
+        m1.assert_not_called()
+
     def test_update_nirspec_footprint(self, mocker, overlay_controls):
         # update function is called always, regardless of current state
         m1 = mocker.patch.object(overlay_controls, "_update_footprint")
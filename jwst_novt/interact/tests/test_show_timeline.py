@@ -125,6 +125,30 @@ class TestShowTimeline:
         assert m1.call_count == 1
         m1.assert_called_with(filename=f"novt_timeline_{date_str}.png")
 
+    def test_plot_observers(self, timeline_controls, mocker):
+        m1 = mocker.patch.object(timeline_controls, "_make_timeline")
+        n_update, n_repeat = 2, 4
+
+        # controls do not update the plot before it is shown
+        timeline_controls.set_instrument.value = "NIRSpec"
+        assert m1.call_count == 0
+
+        # once shown, control changes re-make the plot
+        timeline_controls._show_plot()
+        assert m1.call_count == 1
+        timeline_controls.set_instrument.value = "NIRCam"
+        assert m1.call_count == n_update
+
+        # observers are attached only once
+        timeline_controls._show_plot()
+        timeline_controls.set_instrument.value = "NIRSpec"
+        assert m1.call_count == n_repeat
+
+        # closing the plot detaches them
+        timeline_controls._clear_plot()
+        timeline_controls.set_instrument.value = "NIRCam"
+        assert m1.call_count == n_repeat
+
     def test_update_colors_no_figure(self, timeline_controls):
         assert timeline_controls.figure is None
         # nothing happens
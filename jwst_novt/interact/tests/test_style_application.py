@@ -1,4 +1,5 @@
 import pytest
+from traitlets import TraitError
 
 try:
     import ipywidgets as ipw
@@ -96,6 +97,27 @@ class TestStyleApplication:
         assert not hasattr(application_style.nirspec_controls, "bad")
         assert application_style.nirspec_controls.dec == orig_dec
 
+        # linked controls are updated too
+        assert application_style.timeline_controls.ra == nrs_config["ra"]
+
+    def test_update_from_config_validation(self, application_style):
+        controls = application_style.nirspec_controls
+        orig_dec = controls.dec
+
+        # reject any new dec value in cross-validation, which is
+        # deferred while notifications are held
+        def reject(*args):
+            msg = "bad dec"
+            raise TraitError(msg)
+
+        controls._register_validator(reject, ["dec"])
+        nrs_config = {"ra": 100.0, "dec": 10.0}
+        application_style.uploaded_data.configuration = {"nirspec": nrs_config}
+
+        # only the bad value is skipped
+        assert controls.ra == nrs_config["ra"]
+        assert controls.dec == orig_dec
+
     def test_update_to_config(self, application_style):
         # update control value
         application_style.nirspec_controls.ra = 100.0
@@ -1,11 +1,20 @@
+import asyncio
 import base64
+import functools
+import gzip
 
 import ipyvuetify as v
 import ipywidgets as ipw
 
 from jwst_novt.constants import NOVT_DIR
 
-__all__ = ["read_image", "ToggleButton", "FileDownloadLink"]
+__all__ = [
+    "read_image",
+    "encode_data",
+    "Debouncer",
+    "ToggleButton",
+    "FileDownloadLink",
+]
 
 
 def read_image(image_file, width="100px", height="100px", margin="10px"):
@@ -28,9 +37,7 @@ def read_image(image_file, width="100px", height="100px", margin="10px"):
     widget : ipywidgets.Image
         Image widget.
     """
-    image_path = NOVT_DIR / "data" / image_file
-    with image_path.open("rb") as fh:
-        image = fh.read()
+    image = _image_bytes(image_file)
     image_widget = ipw.Image(value=image, format="png", width=width, height=height)
     image_widget.layout.object_fit = "contain"
     if margin is not None:
@@ -38,6 +45,91 @@ def read_image(image_file, width="100px", height="100px", margin="10px"):
     return image_widget
 
 
+@functools.cache
+def _image_bytes(image_file):
+    """Read raw bytes for an image in the data directory, once per session."""
+    image_path = NOVT_DIR / "data" / image_file
+    return image_path.read_bytes()
+
+
+def encode_data(data, *, compress=False):
+    """
+    Encode text for use in a data URL.
+
+    Parameters
+    ----------
+    data : str
+        Text to encode.
+    compress : bool, optional
+        If set, the text is gzip-compressed before encoding.
+
+    Returns
+    -------
+    payload : str
+        Base64-encoded UTF-8 bytes for the input text.
+    """
+    raw = data.encode("utf-8")
+    if compress:
+        raw = gzip.compress(raw, compresslevel=1, mtime=0)
+    return base64.b64encode(raw).decode("ascii")
+
+
+class Debouncer:
+    """
+    Delay calls to a function until a burst of calls has ended.
+
+    When an asyncio event loop is running (e.g. in a Jupyter kernel),
+    each call cancels any pending call and schedules a new one after
+    `wait` seconds, so only the last call in a burst is executed.
+    Otherwise, calls are passed through immediately.
+
+    Parameters
+    ----------
+    func : callable
+        The function to call.
+    wait : float, optional
+        Time to wait for further calls, in seconds.
+    on_error : callable, optional
+        If provided, `errors` raised by a scheduled call are passed
+        to this function instead of the event loop's exception handler.
+        Errors from immediate calls are always raised.
+    errors : tuple of type, optional
+        Exception types to pass to `on_error`.
+    """
+
+    def __init__(self, func, wait=0.1, on_error=None, errors=(Exception,)):
+        self.func = func
+        self.wait = wait
+        self.on_error = on_error
+        self.errors = errors
+        self._handle = None
+
+    def __call__(self, *args, **kwargs):
+        """Schedule a call to the function, replacing any pending call."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # no event loop: call directly
+            self.func(*args, **kwargs)
+            return
+
+        if self._handle is not None:
+            self._handle.cancel()
+        self._handle = loop.call_later(
+            self.wait, functools.partial(self._call_later, *args, **kwargs)
+        )
+
+    def _call_later(self, *args, **kwargs):
+        """Call the function from the event loop, reporting errors."""
+        if self.on_error is None:
+            self.func(*args, **kwargs)
+            return
+        try:
+            self.func(*args, **kwargs)
+        except self.errors as err:
+            self.on_error(err)
+
+
 class ToggleButton(v.Btn):
     """
     Button widget with styling classes and toggle methods.
@@ -76,32 +168,45 @@ class ToggleButton(v.Btn):
             self.class_list.replace(self.alternate_class, "primary")
 
 
-class FileDownloadLink(ipw.HTML):
+class FileDownloadLink(v.Btn):
     """
-    Clickable HTML link to download a small file.
+    Button with a link to download a small file.
 
-    On creation, the HTML element contains only input text
-    values and is disabled. Use the `edit_link` method to set a
-    link in the element and enable the element.
+    On creation, the button contains only prefix text and
+    is disabled. Use the `edit_link` method to set a link in the
+    button and enable it.
 
     File contents are stored client-side after the link is
     created, so this method is suitable only for very small files.
-    Clear the link after download with the `clear_link` method.
+    The link is cleared when the button is clicked, or it may be
+    cleared directly with the `clear_link` method.
+
+    Parameters
+    ----------
+    prefix : str, optional
+        Text to display on the button, before the file name.
     """
 
-    def __init__(self, *args, **kwargs):
-        self.value = ""
-        self.prefix = kwargs.get("value", "")
+    def __init__(self, prefix="", **kwargs):
+        super().__init__(class_="mx-2 my-2", children=[prefix], **kwargs)
+        self.prefix = prefix
         self.url = ""
-        self.style_value = "color: #00617E"
         self.down_arrow = "\u2913"
 
-        super().__init__(*args, **kwargs)
+        # last file contents and compression setting, with their
+        # encoded form, for reuse on repeat downloads
+        self._last_data = None
+        self._last_payload = None
+
         self.disabled = True
+        self.on_event("click", self.clear_link)
 
-    def edit_link(self, filename, data):
+    def edit_link(self, filename, data, *, compress=False):
         """
-        Edit the HTML element to add a link to download a file.
+        Set the button link to download a file.
+
+        If the file contents and compression setting match the
+        previous call, the previously encoded contents are reused.
 
         Parameters
         ----------
@@ -109,25 +214,41 @@ class FileDownloadLink(ipw.HTML):
             Filename to assign to the file on download.
         data : str
             Contents of the file.
+        compress : bool, optional
+            If set, the file is gzip-compressed for download.
         """
-        b64 = base64.b64encode(data.encode())
-        payload = b64.decode()
-        self.url = f"data:text/plain;base64,{payload}"
-
-        html = (
-            f"<a "
-            f'style="{self.style_value}"'
-            f'download="{filename}" '
-            f'href="{self.url}" '
-            f'target="_blank">'
-            f"{self.prefix} {filename} {self.down_arrow}"
-            f"</a>"
-        )
-        self.value = html
-        self.disabled = False
+        if (data, compress) != self._last_data:
+            self._last_payload = encode_data(data, compress=compress)
+            self._last_data = (data, compress)
+        mime_type = "application/gzip" if compress else "text/plain"
+        self.set_data_url(filename, self._last_payload, mime_type=mime_type)
+
+    def set_data_url(self, filename, payload, mime_type="text/plain"):
+        """
+        Set the button link to pre-encoded file contents.
+
+        Parameters
+        ----------
+        filename : str
+            Filename to assign to the file on download.
+        payload : str
+            Base64-encoded contents of the file, as returned
+            by `encode_data`.
+        mime_type : str, optional
+            Media type for the file contents.
+        """
+        self.url = f"data:{mime_type};base64,{payload}"
+        with self.hold_sync():
+            self.href = self.url
+            self.attributes = {"download": filename}
+            self.children = [f"{self.prefix} {filename} {self.down_arrow}"]
+            self.disabled = False
 
     def clear_link(self, *args, **kwargs):
-        """Clear any current link out of the HTML element and disable it."""
+        """Clear any current link out of the button and disable it."""
         self.url = ""
-        self.value = self.prefix
-        self.disabled = True
+        with self.hold_sync():
+            self.href = None
+            self.attributes = {}
+            self.children = [self.prefix]
+            self.disabled = True
@@ -1,3 +1,7 @@
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import pytest
 import regions
 from astropy.coordinates import SkyCoord
@@ -28,6 +32,39 @@ def test_instrument_footprints(instrument, n_reg):
         assert isinstance(r, regions.PolygonSkyRegion)
 
 
+def test_footprints_threaded():
+    ra = 202.4695898
+    dec = 47.1951868
+    angles = [0.0, 45.0, 90.0, 135.0]
+
+    # footprints made in parallel match those made serially
+    expected = [fp.nirspec_footprint(ra, dec, pa) for pa in angles]
+    with ThreadPoolExecutor(max_workers=len(angles)) as pool:
+        results = list(pool.map(lambda pa: fp.nirspec_footprint(ra, dec, pa), angles))
+    for reg, exp in zip(results, expected):
+        for r1, r2 in zip(reg[1:], exp[1:]):
+            assert np.allclose(r1.vertices.ra.deg, r2.vertices.ra.deg)
+            assert np.allclose(r1.vertices.dec.deg, r2.vertices.dec.deg)
+
+
+def test_float32_footprints(monkeypatch):
+    ra = 202.4695898
+    dec = 47.1951868
+    pa = 25.0
+
+    expected = fp.nircam_short_footprint(ra, dec, pa)
+    monkeypatch.setattr(fp, "USE_FLOAT32_FOOTPRINTS", True)
+    reg = fp.nircam_short_footprint(ra, dec, pa)
+    assert len(reg) == len(expected)
+
+    # float32 spacing near RA 200 deg is about 0.05 arcsec,
+    # so vertices may be off by about half that
+    max_sep = 0.03
+    for r1, r2 in zip(reg[1:], expected[1:]):
+        assert r1.vertices.ra.dtype == np.float32
+        assert r1.vertices.separation(r2.vertices).max().arcsec < max_sep
+
+
 @pytest.mark.parametrize(
     ("channel", "dither", "mosaic", "offsets", "n_reg"),
     # n_reg is n_tile * n_dither * n_aperture + 1 center
@@ -91,6 +128,35 @@ def test_nircam_dithers(channel, dither, mosaic, offsets, n_reg):
             assert isinstance(r, regions.PolygonSkyRegion)
 
 
+@pytest.mark.parametrize(
+    ("dither", "mosaic", "include_center"),
+    [("NONE", False, True), ("FULL3", True, True), ("FULL6", True, False)],
+)
+def test_nircam_channel_footprints(dither, mosaic, include_center):
+    ra = 202.4695898
+    dec = 47.1951868
+    pa = 25.0
+    kwargs = {
+        "dither_pattern": dither,
+        "add_mosaic": mosaic,
+        "mosaic_offset": (20, 20),
+        "include_center": include_center,
+    }
+
+    max_sep = 1e-6
+
+    both = fp.nircam_channel_footprints(ra, dec, pa, **kwargs)
+    for channel in ["short", "long"]:
+        expected = fp.nircam_dither_footprint(ra, dec, pa, channel=channel, **kwargs)
+        reg = both[channel]
+        assert isinstance(reg, regions.Regions)
+        assert len(reg) == len(expected)
+        for r1, r2 in zip(reg, expected):
+            assert type(r1) is type(r2)
+            if isinstance(r1, regions.PolygonSkyRegion):
+                assert r1.vertices.separation(r2.vertices).max().arcsec < max_sep
+
+
 @pytest.mark.parametrize("in_file", [True, False])
 def test_source_catalog(catalog_file, catalog_dataframe, in_file):
     if in_file:
@@ -106,6 +172,27 @@ def test_source_catalog(catalog_file, catalog_dataframe, in_file):
     assert len(filler) == expected_filler
 
 
+@pytest.mark.parametrize("in_file", [True, False])
+def test_source_catalog_arrays(catalog_file, catalog_dataframe, in_file):
+    if in_file:
+        catalog = catalog_file
+    else:
+        catalog = catalog_dataframe
+    ra_primary, dec_primary, ra_filler, dec_filler = fp.source_catalog_arrays(catalog)
+
+    # arrays match the regions made by source_catalog
+    primary, filler = fp.source_catalog(catalog)
+    for reg, ra, dec in [
+        (primary, ra_primary, dec_primary),
+        (filler, ra_filler, dec_filler),
+    ]:
+        assert isinstance(ra, np.ndarray)
+        assert isinstance(dec, np.ndarray)
+        assert len(ra) == len(reg)
+        assert np.allclose(ra, [r.center.ra.deg for r in reg])
+        assert np.allclose(dec, [r.center.dec.deg for r in reg])
+
+
 @pytest.mark.parametrize("in_file", [True, False])
 def test_source_catalog_2col(catalog_file_2col, catalog_dataframe_2col, in_file):
     if in_file:
@@ -120,6 +207,62 @@ def test_source_catalog_2col(catalog_file_2col, catalog_dataframe_2col, in_file)
     assert len(primary) == expected_primary
     assert len(filler) == expected_filler
 
+    # input dataframe is not modified
+    assert "flag" not in catalog_dataframe_2col
+
+
+def test_read_radec(tmp_path):
+    text = (
+        "# ra dec flag\n"
+        "\n"
+        "202.42053 47.17906 F\n"
+        "   # indented comment\n"
+        "202.42514 47.29251 P extra\n"
+        "  \n"
+    )
+    expected_ra = [202.42053, 202.42514]
+    expected_dec = [47.17906, 47.29251]
+
+    # comments, blank lines, and extra columns are skipped,
+    # from a path, a text buffer, or a bytes buffer
+    radec_file = tmp_path / "comments.radec"
+    radec_file.write_text(text)
+    for catalog in [
+        radec_file,
+        str(radec_file),
+        io.StringIO(text),
+        io.BytesIO(text.encode()),
+    ]:
+        ra, dec, flag = fp._read_radec(catalog)
+        assert np.allclose(ra, expected_ra)
+        assert np.allclose(dec, expected_dec)
+        assert list(flag) == ["F", "P"]
+
+    # two columns: all sources are primary
+    ra, dec, flag = fp._read_radec(io.StringIO("# ra dec\n202.42053 47.17906\n"))
+    assert np.allclose(ra, expected_ra[:1])
+    assert np.allclose(dec, expected_dec[:1])
+    assert list(flag) == ["P"]
+
+    # mixed rows: the flag is read per row, defaulting to primary
+    ra, dec, flag = fp._read_radec(io.StringIO("10 20\n11 21 F\n"))
+    assert np.allclose(ra, [10, 11])
+    assert np.allclose(dec, [20, 21])
+    assert list(flag) == ["P", "F"]
+
+    ra, dec, flag = fp._read_radec(io.StringIO("10 20 F\n11 21\n"))
+    assert np.allclose(ra, [10, 11])
+    assert np.allclose(dec, [20, 21])
+    assert list(flag) == ["F", "P"]
+
+    # one column: error
+    with pytest.raises(ValueError, match="1 column"):
+        fp._read_radec(io.StringIO("202.42053\n"))
+
+    # comments only: error
+    with pytest.raises(ValueError, match="file is empty"):
+        fp._read_radec(io.BytesIO(b"# ra dec flag\n\n"))
+
 
 def test_source_catalog_errors(tmp_path):
     # empty catalog: raises value error
@@ -9,6 +9,13 @@ from jwst_novt import timeline as tl
 from jwst_novt.constants import JWST_MAXIMUM_DATE
 
 
+@pytest.fixture()
+def clear_maximum_date():
+    tl._retrieve_maximum_date.cache_clear()
+    yield
+    tl._retrieve_maximum_date.cache_clear()
+
+
 def test_timeline():
     ra = 202.4695898
     dec = 47.1951868
@@ -72,13 +79,35 @@ def test_timeline_errors():
         tl.timeline(ra, dec, end_date=Time("2050-01-01"))
 
 
-def test_jwst_maximum_date(mocker):
+@pytest.mark.usefixtures("clear_maximum_date")
+def test_jwst_maximum_date():
     expected = datetime.date.fromisoformat(JWST_MAXIMUM_DATE)
 
     retrieved = tl.jwst_maximum_date()
     assert datetime.date.fromisoformat(retrieved) >= expected
 
+
+@pytest.mark.usefixtures("clear_maximum_date")
+def test_jwst_maximum_date_cache(mocker):
+    # a retrieved date is reused
+    m1 = mocker.patch.object(
+        tl.requests, "get", return_value=mocker.Mock(text="after A.D. 2030-Jun-15")
+    )
+    retrieved = tl.jwst_maximum_date()
+    assert tl.jwst_maximum_date() == retrieved
+    assert m1.call_count == 1
+
+
+@pytest.mark.usefixtures("clear_maximum_date")
+def test_jwst_maximum_date_fallback(mocker):
+    expected = datetime.date.fromisoformat(JWST_MAXIMUM_DATE)
+
     # trigger an error to check fallback
-    mocker.patch.object(tl.requests, "get", side_effect=ValueError("bad request"))
+    m1 = mocker.patch.object(tl.requests, "get", side_effect=ValueError("bad request"))
     fallback = tl.jwst_maximum_date()
     assert datetime.date.fromisoformat(fallback) == expected
+
+    # failures are not cached
+    tl.jwst_maximum_date()
+    n_request = 2
+    assert m1.call_count == n_request
@@ -1,4 +1,5 @@
 import datetime
+import functools
 import re
 
 import numpy as np
@@ -93,28 +94,42 @@ def timeline(ra, dec, start_date=None, end_date=None, instrument=None):
 
 
 def jwst_maximum_date():
-    """Retrieve the last available date for JWST ephemerides."""
+    """
+    Retrieve the last available date for JWST ephemerides.
+
+    A successfully retrieved date is reused for the rest of the current
+    UTC day.
+    """
+    today = datetime.datetime.now(tz=datetime.timezone.utc).date()
+    try:
+        end_date = _retrieve_maximum_date(today)
+    except Exception:
+        # if retrieval fails for any reason, fall back to a known good date
+        end_date = JWST_MAXIMUM_DATE
+    return end_date
+
+
+@functools.lru_cache(maxsize=1)
+def _retrieve_maximum_date(_day):
+    """
+    Retrieve the last available ephemeris date from the JWST service.
+
+    The argument is the current day, used only as the cache key.
+    Failed requests raise an error, so they are not cached.
+    """
     # attempt to retrieve an ephemeris for a date too far in the future
     start_date = JWST_MINIMUM_DATE
     future_date = "9999-01-01"
     request_url = URL.format(start_date, future_date)
-    try:
-        # this should return an error message containing the last good date
-        ephemeris_request = requests.get(request_url, timeout=10)
-
-        # parse the date from the message
-        m = re.match(
-            r".*after A\.D\. (\d{4}-[a-zA-Z]+-\d{1,2})", ephemeris_request.text
-        )
-        dt = m.groups()[0]
-        end_date = (
-            datetime.datetime.strptime(dt, "%Y-%b-%d")
-            .astimezone(datetime.timezone.utc)
-            .strftime("%Y-%m-%d")
-        )
 
-    except Exception:
-        # if the above fails for any reason, fall back to a known good date
-        end_date = JWST_MAXIMUM_DATE
-
-    return end_date
+    # this should return an error message containing the last good date
+    ephemeris_request = requests.get(request_url, timeout=10)
+
+    # parse the date from the message
+    m = re.match(r".*after A\.D\. (\d{4}-[a-zA-Z]+-\d{1,2})", ephemeris_request.text)
+    dt = m.groups()[0]
+    return (
+        datetime.datetime.strptime(dt, "%Y-%b-%d")
+        .astimezone(datetime.timezone.utc)
+        .strftime("%Y-%m-%d")
+    )